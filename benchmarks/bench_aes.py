@@ -0,0 +1,48 @@
+"""
+Benchmark: AES-128-CBC Entschlüsselung eines HLS-Segments (hls-aes) ohne pycryptodome.
+
+    python benchmarks/bench_aes.py [segment_kib]
+
+Vergleicht die alte Byte-Listen-Implementierung (aes_cbc_decrypt) mit der
+T-Table-Implementierung (aes_cbc_decrypt_words) und dem automatisch gewählten Backend.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from yt_dlp import aes  # noqa: E402
+
+
+def _bench(name, func, data, key, iv, repeat=3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data, key, iv)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<28} {best * 1000:10.1f} ms  {len(data) / best / 1024 / 1024:8.2f} MiB/s")
+    return result
+
+
+def main():
+    size_kib = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    data = os.urandom(size_kib * 1024)
+    key, iv = os.urandom(16), os.urandom(16)
+    print(f"Segment: {size_kib} KiB, Backend: {aes._cbc_decrypt_backend().__qualname__}")
+
+    reference = _bench(
+        "aes_cbc_decrypt (Listen)",
+        lambda d, k, i: bytes(aes.aes_cbc_decrypt(list(d), list(k), list(i))),
+        data, key, iv, repeat=1)
+    results = [
+        _bench("aes_cbc_decrypt_words", aes.aes_cbc_decrypt_words, data, key, iv),
+        _bench("Backend", aes._cbc_decrypt_backend(), data, key, iv),
+    ]
+    assert all(r == reference for r in results), "Ergebnisse stimmen nicht überein"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: Control.build_update_commands für eine Download-Liste mit 5000 Tiles.
+
+    python benchmarks/bench_flet_diff.py [tiles]
+
+Misst ein Update nach "ein Tile angehängt" und nach "ein Tile geändert",
+einmal mit dem Präfix/Suffix-Diff (_children_opcodes) und einmal mit dem
+alten SequenceMatcher über die komplette Kinderliste.
+"""
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import flet as ft  # noqa: E402
+from flet.core import control as control_module  # noqa: E402
+
+_fast_opcodes = control_module._children_opcodes
+
+
+def _full_sequence_matcher(previous, current):
+    return SequenceMatcher(None, previous, current).get_opcodes()
+
+
+def _tile(i):
+    return ft.ListTile(title=ft.Text(f"Track {i}"), subtitle=ft.ProgressBar(value=0.0))
+
+
+def _update(lv, index):
+    commands, added, removed = [], [], []
+    start = time.perf_counter()
+    lv.build_update_commands(index, commands, added, removed)
+    return time.perf_counter() - start
+
+
+def _run(tiles, label):
+    index = {"page": None}
+    lv = ft.ListView(controls=[_tile(i) for i in range(tiles)])
+    lv._Control__uid = "lv"
+    _update(lv, index)  # initialer Aufbau
+
+    lv.controls.append(_tile(tiles))
+    t_append = _update(lv, index)
+
+    lv.controls[tiles // 2].subtitle.value = 0.5
+    t_patch = _update(lv, index)
+    print(f"{label:<22} append {t_append * 1000:8.1f} ms   patch {t_patch * 1000:8.1f} ms")
+
+
+def main():
+    tiles = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"ListView mit {tiles} Tiles")
+    control_module._children_opcodes = _full_sequence_matcher
+    _run(tiles, "SequenceMatcher")
+    control_module._children_opcodes = _fast_opcodes
+    _run(tiles, "Präfix/Suffix-Diff")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: Import-Zeit von flet beim Kaltstart.
+
+    python benchmarks/bench_import.py [--runs 10] [--max-ms MS] [--max-modules N] [--bare]
+
+Jeder Lauf startet einen frischen Interpreter und misst die Zeit für den Import
+und die Zahl der geladenen flet-Module. Mit --max-ms / --max-modules endet das
+Skript mit Exit-Code 1, wenn der Median darüber liegt (Regressionstest).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Controls, die main_view benutzt: genau diese Module sollen beim Start geladen werden
+APP_ATTRS = (
+    "Text", "ListView", "ListTile", "Chip", "ProgressBar", "CircleAvatar", "Icon", "Container",
+    "AlertDialog", "TextField", "TextButton", "FilledButton", "FloatingActionButton", "SafeArea",
+    "Column", "Row", "Dropdown", "Colors", "Icons",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+for name in {attrs!r}:
+    getattr({module}, name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "modules": sum(1 for m in sys.modules if m.split(".")[0] == "flet")}}))
+"""
+
+
+def measure(module: str = "flet", attrs=APP_ATTRS, runs: int = 5) -> Dict[str, float]:
+    """
+    Median über runs Läufe: {"ms": Import-Zeit, "modules": geladene flet-Module}
+    """
+    # der Interpreter des Laufs importiert aus src, wie die App
+    env = dict(os.environ, PYTHONPATH=str(SRC) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    code = _PROBE.format(module=module, attrs=tuple(attrs))
+    samples: List[Dict[str, float]] = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, cwd=SRC, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+    return {
+        "ms": statistics.median(s["ms"] for s in samples),
+        "modules": statistics.median(s["modules"] for s in samples),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-Zeit-Benchmark für den Kaltstart")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--max-modules", type=int, default=None)
+    parser.add_argument("--bare", action="store_true", help="nur 'import flet', ohne die Controls der App")
+    args = parser.parse_args()
+
+    result = measure(attrs=() if args.bare else APP_ATTRS, runs=args.runs)
+    print(f"import flet: {result['ms']:.1f} ms, {result['modules']:.0f} flet-Module (Median aus {args.runs})")
+
+    failed = False
+    if args.max_ms is not None and result["ms"] > args.max_ms:
+        print(f"Regression: {result['ms']:.1f} ms > {args.max_ms} ms")
+        failed = True
+    if args.max_modules is not None and result["modules"] > args.max_modules:
+        print(f"Regression: {result['modules']:.0f} Module > {args.max_modules}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
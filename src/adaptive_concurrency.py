@@ -0,0 +1,198 @@
+# Python
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set
+from urllib.parse import urlparse
+
+"""
+Adaptive Parallelität für Downloads und HLS-Fragmente (AIMD).
+- Eingänge: Bytes aus den Progress-Hooks, Status + Latenz jedes Requests aus den yt-dlp request_hooks
+- alle interval Sekunden eine Entscheidung:
+  * 429/5xx gesehen -> beide Limits halbieren, danach kurz abwarten
+  * Latenz eines Hosts deutlich über seinem Bestwert -> um eins verringern
+  * letzte Erhöhung brachte keinen Durchsatz -> zurücknehmen
+  * sonst bei vorhandener Arbeit um eins erhöhen (Downloads, wenn etwas wartet, sonst Fragment-Worker)
+"""
+
+ChangeHook = Callable[[int, int], None]
+
+_EWMA = 0.3
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD-Regler. record_progress und record_request sind thread-safe und werden
+    direkt aus den yt-dlp Hooks der Worker-Threads aufgerufen.
+    """
+
+    def __init__(
+        self,
+        on_change: Optional[ChangeHook] = None,
+        backlog: Optional[Callable[[], int]] = None,
+        initial_downloads: int = 2,
+        min_downloads: int = 1,
+        max_downloads: int = 6,
+        max_fragments: int = 8,
+        interval: float = 3.0,
+        latency_factor: float = 2.0,
+        min_gain: float = 0.05,
+        cooldown_ticks: int = 2,
+    ):
+        self.on_change = on_change
+        self.backlog = backlog or (lambda: 0)
+        self.min_downloads = min_downloads
+        self.max_downloads = max_downloads
+        self.max_fragments = max_fragments
+        self.interval = interval
+        self.latency_factor = latency_factor
+        self.min_gain = min_gain
+        self.cooldown_ticks = cooldown_ticks
+
+        self.downloads = max(min_downloads, min(initial_downloads, max_downloads))
+        self.fragments = 1
+        self.throughput = 0.0  # Bytes/s im letzten Intervall
+
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._last_bytes: Dict[str, int] = {}
+        self._errors: Dict[int, int] = {}
+        self._latency: Dict[str, float] = {}  # EWMA pro Host
+        self._best_latency: Dict[str, float] = {}
+        self._fresh_hosts: Set[str] = set()  # Hosts mit Requests im laufenden Intervall
+        self._last_tick = time.monotonic()
+        self._last_step: Optional[str] = None  # "downloads" / "fragments" nach einer Erhöhung
+        self._throughput_before_step = 0.0
+        self._no_gain: Optional[str] = None  # zuletzt erfolglos erhöhtes Limit, als nächstes das andere probieren
+        self._cooldown = 0
+        self._task = None
+
+        self.decisions: Deque[str] = deque(maxlen=20)
+
+    # Eingänge (Worker-Threads)
+    def record_progress(self, key: str, downloaded_bytes: int) -> None:
+        with self._lock:
+            last = self._last_bytes.get(key, 0)
+            if downloaded_bytes > last:
+                self._bytes += downloaded_bytes - last
+            self._last_bytes[key] = downloaded_bytes
+
+    def finish(self, key: str) -> None:
+        with self._lock:
+            self._last_bytes.pop(key, None)
+
+    def record_request(self, d: dict) -> None:
+        """
+        yt-dlp request_hook: {"url", "status", "elapsed"}
+        """
+        status = d.get("status")
+        host = urlparse(d.get("url") or "").netloc
+        with self._lock:
+            if status == 429 or (status and status >= 500):
+                self._errors[status] = self._errors.get(status, 0) + 1
+            elif status and status < 400 and host:
+                elapsed = float(d.get("elapsed") or 0.0)
+                prev = self._latency.get(host)
+                latency = elapsed if prev is None else prev + _EWMA * (elapsed - prev)
+                self._latency[host] = latency
+                self._best_latency[host] = min(self._best_latency.get(host, latency), latency)
+                self._fresh_hosts.add(host)
+
+    # Steuerung
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def tick(self) -> Optional[str]:
+        """
+        Eine Regel-Entscheidung. Gibt die Begründung zurück, falls sich ein Limit geändert hat.
+        """
+        now = time.monotonic()
+        with self._lock:
+            elapsed = max(1e-6, now - self._last_tick)
+            self._last_tick = now
+            self.throughput = self._bytes / elapsed
+            self._bytes = 0
+            errors, self._errors = self._errors, {}
+            slow_host = next((
+                host for host in self._fresh_hosts
+                if self._latency[host] > self.latency_factor * max(self._best_latency[host], 0.05)
+            ), None)
+            self._fresh_hosts.clear()
+            busy = bool(self._last_bytes)
+
+        old = (self.downloads, self.fragments)
+        reason = None
+        step, self._last_step = self._last_step, None
+
+        if errors:
+            self.downloads = max(self.min_downloads, self.downloads // 2)
+            self.fragments = max(1, self.fragments // 2)
+            self._cooldown = self.cooldown_ticks
+            reason = "HTTP " + ", ".join(f"{status}x{count}" for status, count in sorted(errors.items())) + " -> halbiert"
+        elif slow_host:
+            if self.fragments > 1:
+                self.fragments -= 1
+            else:
+                self.downloads = max(self.min_downloads, self.downloads - 1)
+            reason = f"Latenz {slow_host} gestiegen -> -1"
+        elif self._cooldown:
+            self._cooldown -= 1
+        elif step and self.throughput < self._throughput_before_step * (1 + self.min_gain):
+            # Erhöhung hat nichts gebracht: Leitung voll
+            if step == "downloads":
+                self.downloads = max(self.min_downloads, self.downloads - 1)
+            else:
+                self.fragments = max(1, self.fragments - 1)
+            self._cooldown = self.cooldown_ticks
+            self._no_gain = step
+            reason = f"kein Gewinn durch +1 {step} -> zurück"
+        elif busy:
+            if step:
+                self._no_gain = None
+            self._throughput_before_step = self.throughput
+            more_downloads = self.backlog() > 0 and self.downloads < self.max_downloads
+            more_fragments = self.fragments < self.max_fragments
+            if more_downloads and (self._no_gain != "downloads" or not more_fragments):
+                self.downloads += 1
+                self._last_step = "downloads"
+            elif more_fragments:
+                self.fragments += 1
+                self._last_step = "fragments"
+            if self._last_step:
+                reason = f"{self.throughput / 1024:.0f} KiB/s -> +1 {self._last_step}"
+
+        if (self.downloads, self.fragments) == old:
+            return None
+        self.decisions.append(
+            f"{time.strftime('%H:%M:%S')} {reason}: downloads={self.downloads}, fragments={self.fragments}")
+        if self.on_change:
+            self.on_change(self.downloads, self.fragments)
+        return reason
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            latency = {host: round(value * 1000) for host, value in self._latency.items()}
+        return {
+            "downloads": self.downloads,
+            "fragments": self.fragments,
+            "throughput_kib": round(self.throughput / 1024),
+            "latency_ms": latency,
+            "decisions": list(self.decisions),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.tick()
+            except Exception:
+                pass
@@ -2,17 +2,35 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import platform
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 import re
 
+from adaptive_concurrency import AdaptiveConcurrency
 from download_item import DownloadItem
 from enums import Download_Status
 import download_service, soundcloud_resolver
+from pipeline import Stage
+from resolve_cache import ResolveCache
+from ydl_engine import YdlEngine
 
 ProgressHook = Callable[[dict], None]
 StatusHook = Callable[[Download_Status, Optional[str]], None]
+EntryHook = Callable[[DownloadItem], None]
+
+
+@dataclass
+class _Job:
+    """
+    Ein Track auf dem Weg durch die Pipeline (resolve -> fetch -> postprocess).
+    """
+    item: DownloadItem
+    log: Any = None
+    info: Optional[dict] = None
+    downloaded: Optional[dict] = None
 
 def _detect_music_dir() -> Path:
     """
@@ -53,21 +71,72 @@ def _default_base_dir() -> Path:
 
 class DownloadController:
     """
-    Nimmt link entgegen, zieht Metadaten und Startet Download mit Download_service
+    Nimmt link entgegen, zieht Metadaten und Startet Download mit Download_service.
+    Jeder Track läuft durch drei Stufen mit eigenen Limits:
+      resolve (API) -> fetch (Bandbreite) -> postprocess (CPU, ffmpeg)
+    Das fetch-Limit und die HLS-Fragment-Worker regelt AdaptiveConcurrency anhand von Durchsatz,
+    Latenz und 429/5xx; max_concurrent ist nur der Startwert.
     """
-    def __init__(self, base_dir: Path | str = "storage", max_concurrent: int = 2):
+    def __init__(
+        self,
+        base_dir: Path | str = "storage",
+        max_concurrent: int = 2,
+        max_resolve: int = 4,
+        max_postprocess: Optional[int] = None,
+        max_downloads: int = 6,
+        output_policy: str = download_service.OUTPUT_POLICY,
+        stream_transcode: bool = True,
+    ):
         # auto-Modus unterstützt: legt unter dem lokalen Musik-Ordner "ESC" an
         if base_dir == "auto":
             self.base_dir = _default_base_dir()
         else:
             self.base_dir = Path(base_dir)
-
-        # parallele Downloads begrenzen
-        self._sema = asyncio.Semaphore(max_concurrent)
+        # mp3 (mp3-Transcoding bevorzugt) oder original (Codec der Quelle, nur remux)
+        self.output_policy = output_policy
+        # Umkodieren während des Downloads (ffmpeg liest aus einer Pipe) statt danach aus der Datei
+        self.stream_transcode = stream_transcode
+
+        # Pipeline: max_concurrent begrenzt nur noch die laufenden Downloads,
+        # das mp3-Encoding bekommt eigene Slots (Anzahl Kerne)
+        self.postprocess_stage: Stage[_Job] = Stage(
+            "postprocess", self._postprocess_job, max_postprocess or os.cpu_count() or 1)
+        self.fetch_stage: Stage[_Job] = Stage(
+            "fetch", self._fetch_job, max_concurrent, next_stage=self.postprocess_stage)
+        # resolve läuft dem Download nur so weit voraus, dass fetch immer Nachschub hat
+        # (signierte Stream-URLs laufen ab, Sammlungen sollen nicht komplett vorab extrahiert werden)
+        self.resolve_stage: Stage[_Job] = Stage(
+            "resolve", self._resolve_job, max_resolve, next_stage=self.fetch_stage, max_backlog=max_concurrent)
+
+        self.adaptive = AdaptiveConcurrency(
+            on_change=self._apply_limits,
+            backlog=lambda: self.fetch_stage.queued,
+            initial_downloads=max_concurrent,
+            max_downloads=max(max_concurrent, max_downloads),
+        )
+
+        # geteilte yt-dlp Engine (warme YoutubeDL-Instanzen für Resolver, Download und Postprocessing)
+        self.engine = YdlEngine(
+            max_idle_per_profile=max(2, max_concurrent),
+            request_hooks=[self.adaptive.record_request],
+        )
+
+        # wiederholte Resolves (erneut hinzugefügt, Retry, App-Neustart) ohne API-Anfragen
+        self.resolve_cache = ResolveCache()
 
         # Verwaltung
         self._items: Dict[str, DownloadItem] = {}
         self._tasks: Dict[str, asyncio.Task] = {}
+        # Sammlungs-Item -> aufgefächerte Track-Items
+        self._children: Dict[str, List[DownloadItem]] = {}
+
+    def pipeline_stats(self) -> Dict[str, Dict[str, int]]:
+        return {stage.name: stage.stats() for stage in (self.resolve_stage, self.fetch_stage, self.postprocess_stage)}
+
+    def _apply_limits(self, downloads: int, fragments: int) -> None:
+        # fragments wird beim nächsten Download-Start gelesen
+        self.fetch_stage.set_limit(downloads)
+        self.resolve_stage.max_backlog = downloads
 
     # API für View
     def get_item(self, item_id: str) -> Optional[DownloadItem]:
@@ -81,17 +150,25 @@ class DownloadController:
         if not item:
             return
         item.cancel()
+        for child in self._children.get(item_id, []):
+            if child.status not in (Download_Status.COMPLETED, Download_Status.FAILED, Download_Status.CANCELED):
+                child.cancel()
 
     def add_link(
         self,
         url: str,
         on_progress: Optional[ProgressHook] = None,
         on_status: Optional[StatusHook] = None,
-        log = None
+        log = None,
+        on_entry: Optional[EntryHook] = None,
     ) -> DownloadItem:
         """
-        wird von GUI aufgerufen, startet download_service und returned Item für die Listview
+        wird von GUI aufgerufen, startet download_service und returned Item für die Listview.
+        Sets/User/Likes werden aufgefächert: jeder Track bekommt ein eigenes Item, das über on_entry
+        an die View geht (dort werden Kachel und Hooks angelegt).
         """
+        self.adaptive.start()
+
         url = (url or "").strip()
         if not self._is_valid_soundcloud_url(url):
             item = DownloadItem(url=url)
@@ -102,95 +179,208 @@ class DownloadController:
         item = DownloadItem(url=url)
         item.on_progress = on_progress
         item.on_status_change = on_status
-        item.set_status(Download_Status.FETCHING)
 
         self._items[item.id] = item
 
         # Download Process
-        task = asyncio.create_task(self._process_item(item, log))
-        self._tasks[item.id] = task
-        task.add_done_callback(lambda t: self._tasks.pop(item.id, None))
+        if soundcloud_resolver.is_collection_url(url):
+            item.set_status(Download_Status.FETCHING)
+            task = asyncio.create_task(self._expand_collection(item, log, on_entry))
+            self._tasks[item.id] = task
+            task.add_done_callback(lambda t: self._tasks.pop(item.id, None))
+        else:
+            item.set_status(Download_Status.QUEUED)
+            self.resolve_stage.put(_Job(item, log))
 
         return item
 
     # Kernablauf
-    async def _process_item(self, item: DownloadItem, log = None) -> None:
+    async def _expand_collection(self, item: DownloadItem, log = None, on_entry: Optional[EntryHook] = None) -> None:
+        """
+        Listet die Sammlung flach in einem Worker-Thread und reiht jeden Eintrag ein, sobald er ankommt.
+        Die Extraktion der einzelnen Tracks passiert erst in der resolve-Stufe, die dem Download nur knapp vorausläuft.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def produce() -> None:
+            try:
+                for entry in soundcloud_resolver.iter_collection(item.url, self.engine):
+                    if item.canceled:
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, entry)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = asyncio.create_task(asyncio.to_thread(produce))
+        children = self._children.setdefault(item.id, [])
         try:
-            #Metadaten einholen
-            info = await self._resolve_metadata(item)
-            if item.canceled:
-                return
-
-            # Metadaten auf item legen
-            item.title = info.get("title") or item.title
-            item.uploader = info.get("uploader") or info.get("artist") or item.uploader
-            item.image_url = info.get("thumbnail") or item.image_url
-            item.ext = (info.get("ext") or "m4a").lstrip(".")
-
-            #Dateipfad bilden (künstler_-_titelname.ext)
-            out_path = self._make_output_path(
-                self.base_dir,
-                item.uploader or "",
-                item.title or "",
-                item.ext or "m4a",
-            )
-            item.filename = out_path
-
-            # Status “bereit”
-            item.set_status(Download_Status.READY)
+            while (entry := await queue.get()) is not done:
+                if item.canceled:
+                    continue
+                children.append(self._add_entry(entry, log, on_entry))
+                item.title = f"{len(children)} Tracks"
+                item.set_status(Download_Status.FETCHING)
+            await producer
 
             if item.canceled:
                 return
-
-            # Download ausführen. mit sema werden parallele downloads begrenzt.
-            async with self._sema:
-                item.set_status(Download_Status.DOWNLOADING)
-
-                def on_progress_hook(d: dict):
-                    status = d.get("status")
-                    if status == "downloading":
-                        total = d.get("total_bytes") or d.get("total_bytes_estimate")
-                        downloaded = d.get("downloaded_bytes") or 0
-                        speed = d.get("speed")
-                        eta = d.get("eta")
-                        item.update_progress(
-                            downloaded_bytes=int(downloaded),
-                            total_bytes=int(total) if total else None,
-                            speed=float(speed) if speed else None,
-                            eta=int(eta) if eta else None,
-                            status=Download_Status.DOWNLOADING,
-                        )
-                    elif status == "finished":
-                        item.update_progress(
-                            downloaded_bytes=item.total_bytes or item.downloaded_bytes,
-                            total_bytes=item.total_bytes,
-                            status=Download_Status.DOWNLOADING,
-                        )
-                # Python 2.7 warning ist hier irrelevant
-                await asyncio.to_thread(
-                    download_service.download,
-                    info,
-                    out_path= item.filename,
-                    progress_cb=on_progress_hook,
-                    is_canceled=lambda: item.canceled,
-                    log = log
-                )
-
-            if item.canceled:
+            if not children:
+                item.mark_failed("Sammlung enthält keine Tracks")
                 return
-
-            #Fertig
             item.mark_completed()
 
         except Exception as e:
             item.mark_failed(str(e))
 
+    def _add_entry(self, entry: dict, log = None, on_entry: Optional[EntryHook] = None) -> DownloadItem:
+        child = DownloadItem(url=entry["url"], title=entry.get("title"), uploader=entry.get("uploader"))
+        self._items[child.id] = child
+        if on_entry:
+            try:
+                on_entry(child)
+            except Exception:
+                pass
+        child.set_status(Download_Status.QUEUED)
+        self.resolve_stage.put(_Job(child, log))
+        return child
+
+    # Pipeline-Stufen: True = Job geht in die nächste Stufe
+    async def _resolve_job(self, job: _Job) -> bool:
+        item = job.item
+        if item.canceled:
+            return False
+        try:
+            item.set_status(Download_Status.FETCHING)
+            job.info = await self._resolve_into(item)
+            return not item.canceled
+        except Exception as e:
+            self._fail(item, e)
+            return False
+
+    async def _fetch_job(self, job: _Job) -> bool:
+        item = job.item
+        if item.canceled:
+            return False
+        try:
+            item.set_status(Download_Status.DOWNLOADING)
+
+            def on_progress_hook(d: dict):
+                status = d.get("status")
+                if status == "downloading":
+                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                    downloaded = d.get("downloaded_bytes") or 0
+                    self.adaptive.record_progress(item.id, int(downloaded))
+                    speed = d.get("speed")
+                    eta = d.get("eta")
+                    item.update_progress(
+                        downloaded_bytes=int(downloaded),
+                        total_bytes=int(total) if total else None,
+                        speed=float(speed) if speed else None,
+                        eta=int(eta) if eta else None,
+                        status=Download_Status.DOWNLOADING,
+                    )
+                elif status == "finished":
+                    item.update_progress(
+                        downloaded_bytes=item.total_bytes or item.downloaded_bytes,
+                        total_bytes=item.total_bytes,
+                        status=Download_Status.DOWNLOADING,
+                    )
+            # Python 2.7 warning ist hier irrelevant
+            job.downloaded = await asyncio.to_thread(
+                download_service.download,
+                job.info,
+                out_path= item.filename,
+                progress_cb=on_progress_hook,
+                is_canceled=lambda: item.canceled,
+                log = job.log,
+                engine=self.engine,
+                postprocess=False,
+                concurrent_fragments=self.adaptive.fragments,
+                policy=self.output_policy,
+                stream_transcode=self.stream_transcode,
+            )
+            item.conversion = job.downloaded.get("conversion") or download_service.conversion_for(
+                job.downloaded, self.output_policy)
+            item.filename = Path(job.downloaded["filepath"])
+            return not item.canceled
+        except Exception as e:
+            # evtl. waren die gecachten Stream-URLs schon ungültig: beim Retry neu signieren
+            self.resolve_cache.drop_streams(item.url)
+            self._fail(item, e)
+            return False
+        finally:
+            self.adaptive.finish(item.id)
+
+    async def _postprocess_job(self, job: _Job) -> bool:
+        item = job.item
+        if item.canceled:
+            return False
+        try:
+            item.set_status(Download_Status.POSTPROCESSING)
+            processed = await asyncio.to_thread(
+                download_service.run_postprocessors,
+                job.downloaded,
+                log=job.log,
+                engine=self.engine,
+                policy=self.output_policy,
+            )
+            # ffmpeg kann die Endung geändert haben
+            item.filename = Path(processed["filepath"])
+            if not item.canceled:
+                #Fertig
+                item.mark_completed()
+        except Exception as e:
+            self._fail(item, e)
+        return False
+
+    @staticmethod
+    def _fail(item: DownloadItem, e: Exception) -> None:
+        # Abbruch über den Progress-Hook landet als DownloadError hier, Status bleibt CANCELED
+        if not item.canceled:
+            item.mark_failed(str(e))
+
+    async def _resolve_into(self, item: DownloadItem) -> dict:
+        """
+        Holt die Metadaten, legt sie auf das Item, bildet den Dateipfad und setzt den Status auf READY.
+        """
+        #Metadaten einholen
+        info = await self._resolve_metadata(item)
+        if item.canceled:
+            return info
+
+        # Metadaten auf item legen
+        item.title = info.get("title") or item.title
+        item.uploader = info.get("uploader") or info.get("artist") or item.uploader
+        item.image_url = info.get("thumbnail") or item.image_url
+        item.ext = (info.get("ext") or "m4a").lstrip(".")
+
+        #Dateipfad bilden (künstler_-_titelname.ext)
+        out_path = self._make_output_path(
+            self.base_dir,
+            item.uploader or "",
+            item.title or "",
+            item.ext or "m4a",
+        )
+        item.filename = out_path
+
+        # Status “bereit”
+        item.set_status(Download_Status.READY)
+        return info
+
     # Hilfsfunktionen
     async def _resolve_metadata(self, item: DownloadItem) -> dict:
         """
         Erwartet ein dict mit title, uploader, Download-Infos.
         """
-        return await asyncio.to_thread(soundcloud_resolver.resolve, item.url)
+        return await asyncio.to_thread(
+            soundcloud_resolver.resolve,
+            item.url,
+            self.engine,
+            self.resolve_cache,
+            download_service.format_spec(self.output_policy),
+        )
 
     @staticmethod
     def _is_valid_soundcloud_url(url: str) -> bool:
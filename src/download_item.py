@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Callable, Optional, Dict, Any
 from uuid import uuid4
 
-from enums import Download_Status
+from enums import Conversion, Download_Status
 
 ProgressCallback = Callable[[Dict[str, Any]], None]
 StatusCallback = Callable[[Download_Status, Optional[str]], None]
@@ -31,6 +31,7 @@ class DownloadItem:
     speed: Optional[float] = None  # KiB/s
     eta: Optional[int] = None
     error_message: Optional[str] = None
+    conversion: Optional[Conversion] = None  # Weg der Nachbearbeitung (vor dem postprocess-Schritt gesetzt)
 
     # Zeiten
     created_at: datetime = field(default_factory=lambda:datetime.now(timezone.utc))
@@ -110,4 +111,5 @@ class DownloadItem:
             "eta": self.eta,
             "filename": str(self.filename) if self.filename else None,
             "title": self.title,
+            "conversion": self.conversion.name if self.conversion else None,
         }
\ No newline at end of file
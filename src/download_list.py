@@ -0,0 +1,186 @@
+# Python
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import flet as ft
+
+from progress_aggregator import ProgressAggregator
+
+"""
+Virtualisierte Download-Liste.
+- pro DownloadItem nur ein leichtes Zeilenmodell (Row), egal wie lang die Historie wird
+- Kacheln gibt es nur für das sichtbare Fenster + overscan, beim Scrollen werden sie mit anderen Zeilen belegt
+- Platzhalter oben/unten halten die Scrollhöhe (feste Zeilenhöhe row_height)
+- Page._index und die Update-Kosten bleiben dadurch konstant
+"""
+
+# Status -> (Icon, Icon-Farbe, Chip-Hintergrund)
+_STATUS_STYLE = {
+    "READY": (ft.Icons.CHECK_CIRCLE, ft.Colors.GREEN, ft.Colors.GREEN_50),
+    "DOWNLOADING": (ft.Icons.DOWNLOAD, None, ft.Colors.GREY_200),
+    "POSTPROCESSING": (ft.Icons.MUSIC_NOTE, None, ft.Colors.GREY_200),
+    "COMPLETED": (ft.Icons.CHECK, ft.Colors.GREEN, ft.Colors.GREEN_50),
+    "FAILED": (ft.Icons.ERROR, ft.Colors.RED, ft.Colors.RED_50),
+}
+_DEFAULT_STYLE = (ft.Icons.DOWNLOAD, None, ft.Colors.GREY_200)
+
+
+@dataclass
+class Row:
+    """
+    Anzeigezustand eines DownloadItems. Wird von den Hooks geändert, danach DownloadList.changed(row).
+    """
+    subtitle: str = ""
+    title: str = "Lade Metadaten..."
+    image_url: Optional[str] = None
+    status: Optional[str] = None  # Name des Download_Status, None = noch nicht gestartet
+    progress: float = 0.0
+    # Kachel, mit der die Zeile gerade belegt ist (None = außerhalb des Fensters)
+    tile: Optional["_Tile"] = field(default=None, repr=False, compare=False)
+
+
+class _Tile:
+    """
+    Wiederverwendbare Kachel (Avatar, Titel, Untertitel, Fortschritt, Status-Chip).
+    """
+
+    def __init__(self, height: float):
+        self.title = ft.Text("", weight=ft.FontWeight.W_600)
+        self.subtitle = ft.Text("", color=ft.Colors.GREY_700, size=12, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS)
+        self.avatar_icon = ft.Icon(ft.Icons.AUDIO_FILE)
+        self.avatar = ft.CircleAvatar(radius=24, bgcolor=ft.Colors.GREY_200, content=self.avatar_icon)
+        self.chip_label = ft.Text("")
+        self.chip_icon = ft.Icon(ft.Icons.DOWNLOAD)
+        self.chip = ft.Chip(label=self.chip_label, leading=self.chip_icon, bgcolor=ft.Colors.GREY_200)
+        self.progress_bar = ft.ProgressBar(value=0.0, width=220)
+        self.control = ft.Container(
+            ft.ListTile(
+                leading=self.avatar,
+                title=self.title,
+                subtitle=ft.Column([self.subtitle, self.progress_bar], spacing=4, tight=True),
+                trailing=self.chip,
+                dense=False,
+            ),
+            height=height,
+            padding=ft.padding.only(bottom=8),
+        )
+
+    def bind(self, row: Optional[Row]) -> None:
+        # nur geänderte Werte gehen beim nächsten Update raus
+        if row is None:
+            self.control.visible = False
+            return
+        self.control.visible = True
+        self.title.value = row.title
+        self.subtitle.value = row.subtitle
+        self.avatar.foreground_image_src = row.image_url
+        self.avatar_icon.visible = not row.image_url
+        icon, color, bgcolor = _STATUS_STYLE.get(row.status, _DEFAULT_STYLE)
+        self.chip_label.value = row.status or "Ausstehend"
+        self.chip_icon.name = icon
+        self.chip_icon.color = color
+        self.chip.bgcolor = bgcolor
+        self.progress_bar.value = row.progress
+
+
+class DownloadList:
+    """
+    ListView mit fester Kachelzahl. add/changed sind thread-safe und können aus den Hooks aufgerufen werden.
+    """
+
+    def __init__(
+        self,
+        page: ft.Page,
+        updates: ProgressAggregator,
+        row_height: float = 96,
+        overscan: int = 4,
+        padding: float = 12,
+    ):
+        self.page = page
+        self.updates = updates
+        self.row_height = row_height
+        self.overscan = overscan
+        self.padding = padding
+        self.rows: List[Row] = []
+
+        self._lock = threading.Lock()
+        self._tiles: List[_Tile] = []
+        self._first = 0  # Index der Zeile in der ersten Kachel
+        self._pixels = 0.0
+        self._viewport = float(page.height or 800)  # bis zum ersten Scroll-Event: Fensterhöhe
+
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+        self.list_view = ft.ListView(
+            [self._top, self._bottom],
+            expand=True,
+            padding=padding,
+            auto_scroll=True,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+        )
+
+    def add(self, label: str) -> Row:
+        """
+        Neue Zeile am Ende. Gesendet wird mit dem nächsten Tick der ProgressAggregator.
+        """
+        row = Row(subtitle=label)
+        with self._lock:
+            self.rows.append(row)
+            self._layout()
+        self.updates.mark_dirty(self.list_view)
+        return row
+
+    def changed(self, row: Row) -> None:
+        with self._lock:
+            tile = row.tile
+            if tile is None:
+                # nicht sichtbar: wird beim Hineinscrollen aus dem Zeilenmodell belegt
+                return
+            tile.bind(row)
+        self.updates.mark_dirty(tile.control)
+
+    def stats(self) -> dict:
+        return {"rows": len(self.rows), "tiles": len(self._tiles), "first": self._first}
+
+    # Hilfsfunktionen
+    def _on_scroll(self, e: ft.OnScrollEvent) -> None:
+        with self._lock:
+            before = (self._first, len(self._tiles))
+            self._pixels = max(0.0, (e.pixels or 0.0) - self.padding)
+            if e.viewport_dimension:
+                self._viewport = e.viewport_dimension
+            self._layout()
+            if (self._first, len(self._tiles)) == before:
+                return
+        self.page.schedule_update()
+
+    def _layout(self) -> None:
+        """
+        Belegt die Kacheln mit den Zeilen des aktuellen Fensters (Lock muss gehalten werden).
+        """
+        size = math.ceil(self._viewport / self.row_height) + 2 * self.overscan
+        if len(self._tiles) < size:
+            while len(self._tiles) < size:
+                self._tiles.append(_Tile(self.row_height))
+            self.list_view.controls = [self._top, *(tile.control for tile in self._tiles), self._bottom]
+
+        count = len(self.rows)
+        first = max(0, int(self._pixels // self.row_height) - self.overscan)
+        first = min(first, max(0, count - len(self._tiles)))
+        for row in self.rows[self._first:self._first + len(self._tiles)]:
+            row.tile = None
+        for i, tile in enumerate(self._tiles):
+            row = self.rows[first + i] if first + i < count else None
+            if row is not None:
+                row.tile = tile
+            tile.bind(row)
+        self._first = first
+
+        shown = min(len(self._tiles), count - first)
+        self._top.height = first * self.row_height
+        self._bottom.height = (count - first - shown) * self.row_height
@@ -4,11 +4,18 @@ import platform
 from pathlib import Path
 from typing import Callable, Optional
 import yt_dlp  # pip install yt-dlp
+from yt_dlp.postprocessor import FFmpegExtractAudioPP
 import shutil
 
+from enums import Conversion
+
+from soundcloud_resolver import ALLOWED_EXTRACTORS
+from ydl_engine import YdlEngine
+
 """
 Lädt den SoundCloud-Track nach out_path.
 - out_path: system music ordner/ESC/filename.ext
+- info["info_dict"]: vom Resolver extrahiertes info dict, wird direkt weiterverarbeitet
 """
 
 
@@ -37,22 +44,124 @@ def _ffmpeg_localer() -> str | None:
     return None
 
 
+PROFILE = "download"
+PP_PROFILE = "postprocess"
+
+# Ausgabe-Policy
+OUTPUT_MP3 = "mp3"            # mp3-Datei: das mp3-Transcoding von SoundCloud bevorzugen, nur sonst umkodieren
+OUTPUT_ORIGINAL = "original"  # Codec der Quelle behalten, höchstens den Container wechseln
+OUTPUT_POLICY = OUTPUT_MP3
+
+# SoundCloud liefert für mp3 kein codecs= im mime type, acodec ist dann leer
+_FORMAT_SPECS = {
+    OUTPUT_MP3: "bestaudio[ext=mp3]/bestaudio[acodec=mp3]/bestaudio/best",
+    OUTPUT_ORIGINAL: "bestaudio/best",
+}
+
+POSTPROCESSORS = {
+    OUTPUT_MP3: [
+        {
+            "key": "FFmpegExtractAudio",
+            "preferredcodec": "mp3",
+            "preferredquality": "0",
+        }
+    ],
+    # "best": verlustfrei, gängige Audio-Formate werden gar nicht angefasst
+    OUTPUT_ORIGINAL: [
+        {
+            "key": "FFmpegExtractAudio",
+            "preferredcodec": "best",
+        }
+    ],
+}
+
+
+def format_spec(policy: str = OUTPUT_POLICY) -> str:
+    return _FORMAT_SPECS[policy]
+
+
+def conversion_for(downloaded: dict, policy: str = OUTPUT_POLICY) -> Conversion:
+    """
+    Welchen Weg FFmpegExtractAudioPP für die geladene Datei nehmen wird (gleiche Regeln wie in dessen run()).
+    """
+    ext = downloaded.get("ext")
+    acodec = (downloaded.get("acodec") or "").split(".")[0]
+    if policy == OUTPUT_MP3:
+        return Conversion.KEEP if "mp3" in (ext, acodec) else Conversion.TRANSCODE
+    if ext in FFmpegExtractAudioPP.COMMON_AUDIO_EXTS:
+        return Conversion.KEEP
+    return Conversion.REMUX
+
+
+def ydl_opts(policy: str = OUTPUT_POLICY) -> dict:
+    """
+    Options-Profil für den Download. Alles was pro Track wechselt (outtmpl, Hooks, Logger)
+    wird erst beim Aufruf gesetzt, damit die Engine die YoutubeDL-Instanzen wiederverwenden kann.
+    Die Postprocessoren laufen getrennt (postprocess_opts), damit ffmpeg keinen Download-Slot belegt.
+    """
+    opts = {
+        "format": format_spec(policy),
+        "noplaylist": True,
+        "allowed_extractors": ALLOWED_EXTRACTORS,
+        "verbose": True,
+        # HLS-Fragmente im Speicher halten statt als -FragN Dateien (weniger Schreibzugriffe auf Android)
+        "fragments_in_memory": True,
+        # .ytdl Resume-Status nur alle 5s / 50 Fragmente schreiben
+        "ytdl_file_interval": 5,
+        "ytdl_file_fragments": 50,
+    }
+    return _apply_ffmpeg_location(opts)
+
+
+def postprocess_opts(policy: str = OUTPUT_POLICY) -> dict:
+    """
+    Options-Profil für die Nachbearbeitung (ffmpeg) einer bereits geladenen Datei.
+    """
+    opts = {
+        "verbose": True,
+        "postprocessors": POSTPROCESSORS[policy],
+    }
+    return _apply_ffmpeg_location(opts)
+
+
+def _apply_ffmpeg_location(opts: dict) -> dict:
+    m = platform.machine().lower()
+    if "x86_64" in m or "amd64" in m:
+        opts["ffmpeg_location"] = "/usr/bin/ffmpeg"
+    return opts
+
+
 def download(
     info: dict,
     out_path: Path,
     progress_cb: Optional[Callable[[dict], None]] = None,
     is_canceled: Optional[Callable[[], bool]] = None,
-    log: Optional[object] = None
-) -> None:
-
+    log: Optional[object] = None,
+    engine: Optional[YdlEngine] = None,
+    postprocess: bool = True,
+    concurrent_fragments: int = 1,
+    policy: str = OUTPUT_POLICY,
+    stream_transcode: bool = False,
+) -> dict:
+    """
+    Gibt das info dict der geladenen Datei zurück (mit "filepath").
+    postprocess=False: nur laden, die Nachbearbeitung macht der Aufrufer mit run_postprocessors.
+    concurrent_fragments: parallele HLS-Fragment-Downloads für diesen Track.
+    policy: Ausgabe-Policy (OUTPUT_MP3 / OUTPUT_ORIGINAL), bestimmt Format-Auswahl und Nachbearbeitung.
+    stream_transcode: muss umkodiert werden, laufen die Bytes schon während des Downloads in ffmpeg
+                      (keine Zwischendatei); die Nachbearbeitung ist danach Conversion.KEEP.
+    """
 
     url = info.get("webpage_url")
-    if not url:
+    info_dict = info.get("info_dict")
+    if not url and not info_dict:
         raise ValueError("download_service: URL missing")
 
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    outtmpl = str(out_path.parent / out_path.stem)
+    # Endung der tatsächlich geladenen Datei; ohne Postprocessor (Conversion.KEEP) bleibt sie so liegen
+    stem = out_path.stem.replace("%", "%%")
+    outtmpl = str(out_path.parent / f"{stem}.%(ext)s")
 
     def _hook(d: dict):
         if is_canceled and is_canceled():
@@ -64,44 +173,128 @@ def download(
             except Exception:
                 pass
 
+    if engine is not None:
+        engine.register_profile(PROFILE, ydl_opts(policy))
+        overrides = {"concurrent_fragment_downloads": concurrent_fragments}
+        with engine.session(PROFILE, progress_hooks=[_hook], logger=log, outtmpl=outtmpl, overrides=overrides) as ydl:
+            downloaded = _download_info(ydl, info_dict, url, is_canceled, policy if stream_transcode else None)
+    else:
+        opts = ydl_opts(policy)
+        opts.update({
+            "outtmpl": outtmpl,
+            "progress_hooks": [_hook],
+            "logger": log,
+            "concurrent_fragment_downloads": concurrent_fragments,
+        })
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            downloaded = _download_info(ydl, info_dict, url, is_canceled, policy if stream_transcode else None)
 
-    ydl_opts_arm64 = {
-        "format": "bestaudio/best",
-        "outtmpl": outtmpl,
-        "noplaylist": True,
-        "progress_hooks": [_hook],
-        "logger": log,
-        "verbose": True,
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "0",
-            }
-        ],
-    }
+    if postprocess:
+        downloaded = run_postprocessors(downloaded, log=log, engine=engine, policy=policy)
+    return downloaded
 
-    ydl_opts_x64 = {
-        "format": "bestaudio/best",
-        "outtmpl": outtmpl,
-        "noplaylist": True,
-        "progress_hooks": [_hook],
-        "ffmpeg_location": "/usr/bin/ffmpeg",
-        "logger": log,
-        "verbose": True,
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "0",
-            }
-        ],
+
+def run_postprocessors(
+    downloaded: dict,
+    log: Optional[object] = None,
+    engine: Optional[YdlEngine] = None,
+    policy: str = OUTPUT_POLICY,
+) -> dict:
+    """
+    Führt die Postprocessoren (mp3-Extraktion) auf einer von download() geladenen Datei aus.
+    Passt die Datei schon zur Policy (Conversion.KEEP), läuft gar kein ffmpeg/ffprobe.
+    """
+    filepath = downloaded.get("filepath")
+    if not filepath:
+        raise ValueError("download_service: filepath missing")
+    if conversion_for(downloaded, policy) is Conversion.KEEP:
+        return downloaded
+
+    if engine is not None:
+        engine.register_profile(PP_PROFILE, postprocess_opts(policy))
+        with engine.session(PP_PROFILE, logger=log) as ydl:
+            return ydl.post_process(filepath, dict(downloaded))
+
+    opts = postprocess_opts(policy)
+    opts["logger"] = log
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        return ydl.post_process(filepath, dict(downloaded))
+
+
+def _download_info(
+    ydl: yt_dlp.YoutubeDL,
+    info_dict: Optional[dict],
+    url: Optional[str],
+    is_canceled: Optional[Callable[[], bool]] = None,
+    stream_policy: Optional[str] = None,
+) -> dict:
+    """
+    Lädt aus dem bereits extrahierten info dict (wie download_with_info_file).
+    Nur wenn das fehlschlägt (z.B. signierte Stream-URL abgelaufen) wird die URL neu extrahiert.
+    stream_policy: Ausgabe-Policy, nach der ggf. schon beim Download umkodiert wird (_download_streaming).
+    """
+    if not info_dict:
+        return _downloaded_file(ydl.extract_info(url, download=True))
+
+    try:
+        if stream_policy:
+            streamed = _download_streaming(ydl, info_dict, stream_policy)
+            if streamed is not None:
+                return streamed
+        return _downloaded_file(ydl.process_ie_result(dict(info_dict), download=True))
+    except (yt_dlp.utils.DownloadError, yt_dlp.utils.ReExtractInfo) as e:
+        if (is_canceled and is_canceled()) or not url:
+            raise
+        ydl.report_warning(f"Download aus info dict fehlgeschlagen: {e}; versuche erneut mit URL {url}")
+        return _downloaded_file(ydl.extract_info(url, download=True))
+
+
+def _download_streaming(ydl: yt_dlp.YoutubeDL, info_dict: dict, policy: str) -> Optional[dict]:
+    """
+    Download und Umkodierung gleichzeitig: der Downloader schreibt statt in die .part Datei
+    direkt in ffmpegs stdin (progressive HTTP oder HLS-Fragmente in Reihenfolge).
+    None, wenn das gewählte Format nicht umkodiert werden muss oder nicht gestreamt werden kann;
+    dann läuft der normale Weg (Datei + Postprocessor).
+    """
+    info = ydl.process_ie_result(dict(info_dict), download=False)
+    if info.get("requested_formats") or conversion_for(info, policy) is not Conversion.TRANSCODE:
+        return None
+
+    pp_args = {key: value for key, value in POSTPROCESSORS[policy][0].items() if key != "key"}
+    pp = FFmpegExtractAudioPP(ydl, **pp_args)
+    filename = ydl.prepare_filename(info)
+    opened = pp.pipe_writer({**info, "filepath": filename})
+    if opened is None:
+        return None
+
+    writer, new_path = opened
+    try:
+        if not ydl.dl(filename, info, pipe=writer):
+            raise yt_dlp.utils.DownloadError("download_service: Download fehlgeschlagen")
+        writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
+
+    # "conversion": der Weg, den der Track genommen hat (conversion_for sieht jetzt nur noch eine fertige mp3)
+    downloaded = {
+        **info,
+        "filepath": new_path,
+        "ext": Path(new_path).suffix.lstrip("."),
+        "conversion": Conversion.TRANSCODE,
     }
-    m = platform.machine().lower()
-    if "x86_64" in m or "amd64" in m:
-        with yt_dlp.YoutubeDL(ydl_opts_x64) as ydl:
-            ydl.download([url])
-        return
-    else:
-        with yt_dlp.YoutubeDL(ydl_opts_arm64) as ydl:
-            ydl.download([url])
\ No newline at end of file
+    downloaded.pop("requested_downloads", None)
+    return downloaded
+
+
+def _downloaded_file(result: Optional[dict]) -> dict:
+    """
+    Führt das Ergebnis von process_ie_result mit dem Eintrag der geladenen Datei zusammen
+    (requested_downloads enthält nur die Felder, die sich vom Video unterscheiden, u.a. filepath).
+    """
+    downloads = (result or {}).get("requested_downloads") or []
+    if not downloads:
+        raise RuntimeError("download_service: nichts heruntergeladen")
+    info = {**result, **downloads[-1]}
+    info.pop("requested_downloads", None)
+    return info
@@ -6,7 +6,14 @@ class DownloadStatus(Enum):
     FETCHING = "FETCHING"
     READY = "READY"
     DOWNLOADING = "DOWNLOADING"
+    POSTPROCESSING = "POSTPROCESSING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
     CANCELED = "CANCELED"
+
+class Conversion(Enum):
+    # Weg der Nachbearbeitung pro Track
+    KEEP = "KEEP"            # Datei bleibt wie geladen, kein ffmpeg
+    REMUX = "REMUX"          # nur Container wechseln (acodec copy)
+    TRANSCODE = "TRANSCODE"  # dekodieren und neu kodieren
 Download_Status: TypeAlias = DownloadStatus
\ No newline at end of file
@@ -0,0 +1,465 @@
+from flet.app import app, app_async
+from flet.core import (
+    alignment,
+    border,
+    border_radius,
+    dropdown,
+    dropdownm2,
+    margin,
+    padding,
+    painting,
+    size,
+)
+from flet.core.adaptive_control import AdaptiveControl
+from flet.core.alert_dialog import AlertDialog
+from flet.core.alignment import Alignment, Axis
+from flet.core.animated_switcher import AnimatedSwitcher, AnimatedSwitcherTransition
+from flet.core.animation import Animation, AnimationCurve, AnimationStyle
+from flet.core.app_bar import AppBar
+from flet.core.audio import (
+    Audio,
+    AudioDurationChangeEvent,
+    AudioPositionChangeEvent,
+    AudioState,
+    AudioStateChangeEvent,
+)
+from flet.core.audio_recorder import (
+    AudioEncoder,
+    AudioRecorder,
+    AudioRecorderState,
+    AudioRecorderStateChangeEvent,
+)
+from flet.core.auto_complete import (
+    AutoComplete,
+    AutoCompleteSelectEvent,
+    AutoCompleteSuggestion,
+)
+from flet.core.autofill_group import (
+    AutofillGroup,
+    AutofillGroupDisposeAction,
+    AutofillHint,
+)
+from flet.core.badge import Badge
+from flet.core.banner import Banner
+from flet.core.blur import Blur, BlurTileMode
+from flet.core.border import Border, BorderSide, BorderSideStrokeAlign
+from flet.core.border_radius import BorderRadius
+from flet.core.bottom_app_bar import BottomAppBar
+from flet.core.bottom_sheet import BottomSheet
+from flet.core.box import (
+    BoxConstraints,
+    BoxDecoration,
+    BoxShadow,
+    BoxShape,
+    ColorFilter,
+    DecorationImage,
+    FilterQuality,
+    ShadowBlurStyle,
+)
+from flet.core.button import Button
+from flet.core.buttons import (
+    BeveledRectangleBorder,
+    ButtonStyle,
+    CircleBorder,
+    ContinuousRectangleBorder,
+    OutlinedBorder,
+    RoundedRectangleBorder,
+    StadiumBorder,
+)
+from flet.core.card import Card, CardVariant
+from flet.core.charts.bar_chart import BarChart, BarChartEvent
+from flet.core.charts.bar_chart_group import BarChartGroup
+from flet.core.charts.bar_chart_rod import BarChartRod
+from flet.core.charts.bar_chart_rod_stack_item import BarChartRodStackItem
+from flet.core.charts.chart_axis import ChartAxis
+from flet.core.charts.chart_axis_label import ChartAxisLabel
+from flet.core.charts.chart_grid_lines import ChartGridLines
+from flet.core.charts.chart_point_line import ChartPointLine
+from flet.core.charts.chart_point_shape import (
+    ChartCirclePoint,
+    ChartCrossPoint,
+    ChartPointShape,
+    ChartSquarePoint,
+)
+from flet.core.charts.line_chart import LineChart, LineChartEvent, LineChartEventSpot
+from flet.core.charts.line_chart_data import LineChartData
+from flet.core.charts.line_chart_data_point import LineChartDataPoint
+from flet.core.charts.pie_chart import PieChart, PieChartEvent
+from flet.core.charts.pie_chart_section import PieChartSection
+from flet.core.checkbox import Checkbox
+from flet.core.chip import Chip
+from flet.core.circle_avatar import CircleAvatar
+from flet.core.colors import Colors
+from flet.core.column import Column
+from flet.core.container import Container, ContainerTapEvent
+from flet.core.control import Control
+from flet.core.control_event import ControlEvent
+from flet.core.cupertino_action_sheet import CupertinoActionSheet
+from flet.core.cupertino_action_sheet_action import CupertinoActionSheetAction
+from flet.core.cupertino_activity_indicator import CupertinoActivityIndicator
+from flet.core.cupertino_alert_dialog import CupertinoAlertDialog
+from flet.core.cupertino_app_bar import CupertinoAppBar
+from flet.core.cupertino_bottom_sheet import CupertinoBottomSheet
+from flet.core.cupertino_button import CupertinoButton
+from flet.core.cupertino_checkbox import CupertinoCheckbox
+from flet.core.cupertino_colors import CupertinoColors
+from flet.core.cupertino_context_menu import CupertinoContextMenu
+from flet.core.cupertino_context_menu_action import CupertinoContextMenuAction
+from flet.core.cupertino_date_picker import (
+    CupertinoDatePicker,
+    CupertinoDatePickerDateOrder,
+    CupertinoDatePickerMode,
+)
+from flet.core.cupertino_dialog_action import CupertinoDialogAction
+from flet.core.cupertino_filled_button import CupertinoFilledButton
+from flet.core.cupertino_icons import CupertinoIcons
+from flet.core.cupertino_list_tile import CupertinoListTile
+from flet.core.cupertino_navigation_bar import CupertinoNavigationBar
+from flet.core.cupertino_picker import CupertinoPicker
+from flet.core.cupertino_radio import CupertinoRadio
+from flet.core.cupertino_segmented_button import CupertinoSegmentedButton
+from flet.core.cupertino_slider import CupertinoSlider
+from flet.core.cupertino_sliding_segmented_button import CupertinoSlidingSegmentedButton
+from flet.core.cupertino_switch import CupertinoSwitch
+from flet.core.cupertino_textfield import CupertinoTextField, VisibilityMode
+from flet.core.cupertino_timer_picker import (
+    CupertinoTimerPicker,
+    CupertinoTimerPickerMode,
+)
+from flet.core.datatable import (
+    DataCell,
+    DataColumn,
+    DataColumnSortEvent,
+    DataRow,
+    DataTable,
+)
+from flet.core.date_picker import (
+    DatePicker,
+    DatePickerEntryMode,
+    DatePickerEntryModeChangeEvent,
+    DatePickerMode,
+)
+from flet.core.dismissible import (
+    Dismissible,
+    DismissibleDismissEvent,
+    DismissibleUpdateEvent,
+)
+from flet.core.divider import Divider
+from flet.core.drag_target import DragTarget, DragTargetEvent
+from flet.core.draggable import Draggable
+from flet.core.dropdown import Dropdown, DropdownOption
+from flet.core.dropdownm2 import DropdownM2
+from flet.core.elevated_button import ElevatedButton
+from flet.core.exceptions import (
+    FletException,
+    FletUnimplementedPlatformEception,
+    FletUnsupportedPlatformException,
+)
+from flet.core.expansion_panel import ExpansionPanel, ExpansionPanelList
+from flet.core.expansion_tile import ExpansionTile, TileAffinity
+from flet.core.file_picker import (
+    FilePicker,
+    FilePickerFileType,
+    FilePickerResultEvent,
+    FilePickerUploadEvent,
+    FilePickerUploadFile,
+)
+from flet.core.filled_button import FilledButton
+from flet.core.filled_tonal_button import FilledTonalButton
+from flet.core.flashlight import Flashlight
+from flet.core.flet_app import FletApp
+from flet.core.floating_action_button import FloatingActionButton
+from flet.core.form_field_control import InputBorder
+from flet.core.geolocator import (
+    Geolocator,
+    GeolocatorActivityType,
+    GeolocatorAndroidSettings,
+    GeolocatorAppleSettings,
+    GeolocatorPermissionStatus,
+    GeolocatorPosition,
+    GeolocatorPositionAccuracy,
+    GeolocatorPositionChangeEvent,
+    GeolocatorSettings,
+    GeolocatorWebSettings,
+)
+from flet.core.gesture_detector import (
+    DragEndEvent,
+    DragStartEvent,
+    DragUpdateEvent,
+    GestureDetector,
+    HoverEvent,
+    LongPressEndEvent,
+    LongPressStartEvent,
+    MultiTapEvent,
+    ScaleEndEvent,
+    ScaleStartEvent,
+    ScaleUpdateEvent,
+    ScrollEvent,
+    TapEvent,
+)
+from flet.core.gradients import (
+    GradientTileMode,
+    LinearGradient,
+    RadialGradient,
+    SweepGradient,
+)
+from flet.core.grid_view import GridView
+from flet.core.haptic_feedback import HapticFeedback
+from flet.core.icon import Icon
+from flet.core.icon_button import IconButton
+from flet.core.icons import Icons
+from flet.core.image import Image
+from flet.core.interactive_viewer import (
+    InteractiveViewer,
+    InteractiveViewerInteractionEndEvent,
+    InteractiveViewerInteractionStartEvent,
+    InteractiveViewerInteractionUpdateEvent,
+)
+from flet.core.list_tile import ListTile, ListTileStyle, ListTileTitleAlignment
+from flet.core.list_view import ListView
+from flet.core.lottie import Lottie
+from flet.core.margin import Margin
+from flet.core.markdown import (
+    Markdown,
+    MarkdownCodeTheme,
+    MarkdownCustomCodeTheme,
+    MarkdownExtensionSet,
+    MarkdownStyleSheet,
+)
+from flet.core.menu_bar import MenuBar, MenuStyle
+from flet.core.menu_item_button import MenuItemButton
+from flet.core.navigation_bar import (
+    NavigationBar,
+    NavigationBarDestination,
+    NavigationBarLabelBehavior,
+)
+from flet.core.navigation_drawer import (
+    NavigationDrawer,
+    NavigationDrawerDestination,
+    NavigationDrawerPosition,
+)
+from flet.core.navigation_rail import (
+    NavigationRail,
+    NavigationRailDestination,
+    NavigationRailLabelType,
+)
+from flet.core.outlined_button import OutlinedButton
+from flet.core.padding import Padding
+from flet.core.page import (
+    AppLifecycleStateChangeEvent,
+    BrowserContextMenu,
+    KeyboardEvent,
+    LoginEvent,
+    Page,
+    PageDisconnectedException,
+    PageMediaData,
+    RouteChangeEvent,
+    ViewPopEvent,
+    Window,
+    WindowEvent,
+    WindowResizeEvent,
+    context,
+)
+from flet.core.pagelet import Pagelet
+from flet.core.painting import (
+    Paint,
+    PaintingStyle,
+    PaintLinearGradient,
+    PaintRadialGradient,
+    PaintSweepGradient,
+)
+from flet.core.permission_handler import (
+    PermissionHandler,
+    PermissionStatus,
+    PermissionType,
+)
+from flet.core.placeholder import Placeholder
+from flet.core.popup_menu_button import (
+    PopupMenuButton,
+    PopupMenuItem,
+    PopupMenuPosition,
+)
+from flet.core.progress_bar import ProgressBar
+from flet.core.progress_ring import ProgressRing
+from flet.core.pubsub.pubsub_client import PubSubClient
+from flet.core.pubsub.pubsub_hub import PubSubHub
+from flet.core.querystring import QueryString
+from flet.core.radio import Radio
+from flet.core.radio_group import RadioGroup
+from flet.core.range_slider import RangeSlider
+from flet.core.ref import Ref
+from flet.core.reorderable_draggable import ReorderableDraggable
+from flet.core.reorderable_list_view import OnReorderEvent, ReorderableListView
+from flet.core.responsive_row import ResponsiveRow
+from flet.core.rive import Rive
+from flet.core.row import Row
+from flet.core.safe_area import SafeArea
+from flet.core.scrollable_control import OnScrollEvent
+from flet.core.search_bar import SearchBar
+from flet.core.segmented_button import Segment, SegmentedButton
+from flet.core.selection_area import SelectionArea
+from flet.core.semantics import Semantics
+from flet.core.semantics_service import Assertiveness, SemanticsService
+from flet.core.shader_mask import ShaderMask
+from flet.core.shake_detector import ShakeDetector
+from flet.core.size import Size
+from flet.core.slider import Slider, SliderInteraction
+from flet.core.snack_bar import DismissDirection, SnackBar, SnackBarBehavior
+from flet.core.stack import Stack, StackFit
+from flet.core.submenu_button import SubmenuButton
+from flet.core.switch import Switch
+from flet.core.tabs import Tab, Tabs
+from flet.core.template_route import TemplateRoute
+from flet.core.text import Text, TextAffinity, TextSelection
+from flet.core.text_button import TextButton
+from flet.core.text_span import TextSpan
+from flet.core.text_style import (
+    TextBaseline,
+    TextDecoration,
+    TextDecorationStyle,
+    TextOverflow,
+    TextStyle,
+    TextThemeStyle,
+)
+from flet.core.textfield import (
+    InputFilter,
+    KeyboardType,
+    NumbersOnlyInputFilter,
+    TextCapitalization,
+    TextField,
+    TextOnlyInputFilter,
+)
+from flet.core.theme import (
+    AppBarTheme,
+    BadgeTheme,
+    BannerTheme,
+    BottomAppBarTheme,
+    BottomSheetTheme,
+    ButtonTheme,
+    CardTheme,
+    CheckboxTheme,
+    ChipTheme,
+    ColorScheme,
+    DataTableTheme,
+    DatePickerTheme,
+    DialogTheme,
+    DividerTheme,
+    ElevatedButtonTheme,
+    ExpansionTileTheme,
+    FilledButtonTheme,
+    FloatingActionButtonTheme,
+    IconButtonTheme,
+    IconTheme,
+    ListTileTheme,
+    NavigationBarTheme,
+    NavigationDrawerTheme,
+    NavigationRailTheme,
+    OutlinedButtonTheme,
+    PageTransitionsTheme,
+    PageTransitionTheme,
+    PopupMenuTheme,
+    ProgressIndicatorTheme,
+    RadioTheme,
+    ScrollbarTheme,
+    SearchBarTheme,
+    SearchViewTheme,
+    SegmentedButtonTheme,
+    SliderTheme,
+    SnackBarTheme,
+    SwitchTheme,
+    SystemOverlayStyle,
+    TabsTheme,
+    TextButtonTheme,
+    TextTheme,
+    Theme,
+    TimePickerTheme,
+    TooltipTheme,
+)
+from flet.core.time_picker import (
+    TimePicker,
+    TimePickerEntryMode,
+    TimePickerEntryModeChangeEvent,
+)
+from flet.core.tooltip import Tooltip, TooltipTriggerMode
+from flet.core.transform import Offset, Rotate, Scale
+from flet.core.transparent_pointer import TransparentPointer
+from flet.core.types import (
+    FLET_APP,
+    FLET_APP_HIDDEN,
+    FLET_APP_WEB,
+    WEB_BROWSER,
+    AppLifecycleState,
+    AppView,
+    BlendMode,
+    BorderRadiusValue,
+    Brightness,
+    ClipBehavior,
+    ColorEnums,
+    ColorValue,
+    ControlEventType,
+    ControlState,
+    ControlStateValue,
+    CrossAxisAlignment,
+    DateTimeValue,
+    Duration,
+    DurationValue,
+    EventType,
+    FloatingActionButtonLocation,
+    FontWeight,
+    IconEnums,
+    IconValue,
+    IconValueOrControl,
+    ImageFit,
+    ImageRepeat,
+    LabelPosition,
+    Locale,
+    LocaleConfiguration,
+    MainAxisAlignment,
+    MarginValue,
+    MouseCursor,
+    NotchShape,
+    Number,
+    OffsetValue,
+    OnFocusEvent,
+    OptionalControlEventCallable,
+    OptionalEventCallable,
+    OptionalNumber,
+    OptionalString,
+    Orientation,
+    PaddingValue,
+    PagePlatform,
+    PointerDeviceType,
+    ResponsiveNumber,
+    RotateValue,
+    ScaleValue,
+    ScrollMode,
+    StrokeCap,
+    StrokeJoin,
+    SupportsStr,
+    TabAlignment,
+    TextAlign,
+    ThemeMode,
+    UrlTarget,
+    VerticalAlignment,
+    VisualDensity,
+    WebRenderer,
+    WindowEventType,
+)
+from flet.core.vertical_divider import VerticalDivider
+from flet.core.video import (
+    PlaylistMode,
+    Video,
+    VideoConfiguration,
+    VideoMedia,
+    VideoSubtitleConfiguration,
+)
+from flet.core.view import View
+from flet.core.webview import (
+    WebView,
+    WebviewConsoleMessageEvent,
+    WebviewJavaScriptEvent,
+    WebviewLogLevelSeverity,
+    WebviewRequestMethod,
+    WebviewScrollEvent,
+)
+from flet.core.window_drag_area import WindowDragArea
@@ -17,6 +17,13 @@ class Connection:
     def send_commands(self, session_id: str, commands: List[Command]):
         raise NotImplementedError()
 
+    def wait_for_send_capacity(self):
+        """
+        Blocks the calling thread while the connection can't keep up with sending.
+        Must not be called while holding the page lock.
+        """
+        pass
+
     def _get_ws_url(self, server: str):
         url = server.rstrip("/")
         if server.startswith("https://"):
@@ -36,9 +36,133 @@ try:
 except ImportError:
     from typing_extensions import Literal
 
+def _children_opcodes(previous: List[int], current: List[int]) -> List[Tuple]:
+    """
+    SequenceMatcher-compatible opcodes for two lists of child hashes.
+
+    Unchanged prefixes and suffixes are matched directly, so appends, removals
+    and in-place changes are O(n). SequenceMatcher only runs on the changed
+    middle part, i.e. when children were actually reordered or replaced.
+    """
+    n_prev, n_cur = len(previous), len(current)
+    prefix = 0
+    max_prefix = min(n_prev, n_cur)
+    while prefix < max_prefix and previous[prefix] == current[prefix]:
+        prefix += 1
+    suffix = 0
+    max_suffix = max_prefix - prefix
+    while (
+        suffix < max_suffix
+        and previous[n_prev - 1 - suffix] == current[n_cur - 1 - suffix]
+    ):
+        suffix += 1
+
+    a_end, b_end = n_prev - suffix, n_cur - suffix
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    if prefix == a_end and prefix < b_end:
+        opcodes.append(("insert", prefix, prefix, prefix, b_end))
+    elif prefix == b_end and prefix < a_end:
+        opcodes.append(("delete", prefix, a_end, prefix, prefix))
+    elif prefix < a_end:
+        sm = SequenceMatcher(None, previous[prefix:a_end], current[prefix:b_end])
+        for tag, a1, a2, b1, b2 in sm.get_opcodes():
+            opcodes.append((tag, a1 + prefix, a2 + prefix, b1 + prefix, b2 + prefix))
+    if suffix:
+        opcodes.append(("equal", a_end, n_prev, b_end, n_cur))
+    return opcodes
+
+
 V = TypeVar("V", str, int, float, bool, Any)
 DV = TypeVar("DV", bound=Optional[Any])
 
+# attributes that are not sent to Flutter or are maintained by the update itself
+_UNTRACKED_ATTRS = frozenset(
+    [
+        "parent",
+        "page",
+        "data",
+        "_Control__page",
+        "_Control__data",
+        "_Control__uid",
+        "_Control__previous_children",
+        "_Control__dirty",
+        "_Control__dirty_children",
+        "_Control__json_attrs",
+        "_Control__json_attrs_below",
+    ]
+)
+
+
+class _ControlList(list):
+    """
+    A list that marks its owner control as changed when it's modified in place,
+    e.g. `column.controls.append(...)`.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, iterable=(), owner: "Optional[Control]" = None) -> None:
+        super().__init__(iterable)
+        self._owner = owner
+
+    def _changed(self) -> None:
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            owner._mark_dirty()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._changed()
+        return result
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, iterable) -> None:
+        super().extend(iterable)
+        self._changed()
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
 
 class Control:
     def __init__(
@@ -57,6 +181,13 @@ class Control:
     ) -> None:
         super().__init__()
 
+        # new controls are sent as a whole with their parent
+        self.__dirty = True
+        self.__dirty_children = False
+        # controls with attributes serialized from nested objects (styles, paddings, ...)
+        # are re-serialized by every update, see build_update_commands()
+        self.__json_attrs = False
+        self.__json_attrs_below = False
         self.__page: Optional[Page] = None
         self.__attrs: Dict[str, Any] = {}
         self.__previous_children = []
@@ -188,12 +319,16 @@ class Control:
 
         if orig_val is None or orig_val[0] != value:
             self.__attrs[name] = (value, dirty)
+            if dirty:
+                self._mark_dirty()
 
     def _set_attr_json(self, name: str, value: V, wrap_attr_dict: bool = False) -> None:
         ov = self._get_attr(name)
         nv = self._convert_attr_json(
             self._wrap_attr_dict(value) if wrap_attr_dict else value
         )
+        if nv is not None:
+            self._mark_json_attrs()
         if ov != nv:
             self._set_attr(name, nv)
 
@@ -392,9 +527,95 @@ class Control:
 
             dest[attr_name_lower] = sval
 
+    def _mark_dirty(self) -> None:
+        # flag the control and let its ancestors know there's a changed control below them;
+        # a flagged ancestor means the rest of the chain is flagged already.
+        # The chain is walked even if the control is flagged itself: a control can be
+        # flagged while it's being added, before its parent is linked.
+        self.__dirty = True
+        ctrl = self
+        while True:
+            parent = ctrl.__dict__.get("parent")
+            if parent is None or parent.__dirty_children:
+                break
+            parent.__dirty_children = True
+            if parent.is_isolated():
+                # isolated controls update their own subtree
+                break
+            ctrl = parent
+
+    def _mark_json_attrs(self) -> None:
+        # nested objects can be changed in place without the control noticing,
+        # so the control and its ancestors are visited by every page-wide update
+        if self.__dict__.get("_Control__json_attrs"):
+            return
+        self.__json_attrs = True
+        parent = self.__dict__.get("parent")
+        if parent is not None:
+            parent._mark_json_attrs_below()
+
+    def _mark_json_attrs_below(self) -> None:
+        ctrl = self
+        while ctrl is not None and not ctrl.__json_attrs_below:
+            ctrl.__json_attrs_below = True
+            ctrl = ctrl.__dict__.get("parent")
+
+    def _link_child(self, ctrl: "Control") -> None:
+        ctrl.parent = self  # set as parent
+        if ctrl.__json_attrs or ctrl.__json_attrs_below:
+            # the child was built before it was linked
+            self._mark_json_attrs_below()
+
+    def _needs_update(self) -> bool:
+        return (
+            self.__dirty
+            or self.__dirty_children
+            or self.__json_attrs
+            or self.__json_attrs_below
+        )
+
     def build_update_commands(
-        self, index, commands, added_controls, removed_controls, isolated: bool = False
+        self,
+        index,
+        commands,
+        added_controls,
+        removed_controls,
+        isolated: bool = False,
+        dirty_only: bool = False,
     ) -> None:
+        """
+        With `dirty_only` only the changed subtrees are visited: controls without changes
+        of their own are neither rebuilt nor diffed and clean children are skipped.
+        Controls with attributes serialized from nested objects, e.g. `Text.style` or
+        `Container.padding`, are always re-serialized, so in-place changes like
+        `text.style.size = 20` are sent by the next `page.update()` as before.
+        """
+        # flags are reset before building, so changes made by other threads
+        # in the meantime are picked up by the next update
+        dirty = self.__dirty
+        self.__dirty = False
+        if dirty_only and not dirty:
+            if self.__json_attrs:
+                # nested objects may have been changed in place
+                update_cmd = self._build_command(update=True)
+                if len(update_cmd.attrs) > 0:
+                    update_cmd.name = "set"
+                    commands.append(update_cmd)
+            # children are unchanged, descend into changed subtrees only
+            if not isolated:
+                self.__dirty_children = False
+                for ctrl in self.__previous_children:
+                    if ctrl._needs_update():
+                        ctrl.build_update_commands(
+                            index,
+                            commands,
+                            added_controls,
+                            removed_controls,
+                            isolated=ctrl.is_isolated(),
+                            dirty_only=True,
+                        )
+            return
+
         update_cmd = self._build_command(update=True)
 
         if len(update_cmd.attrs) > 0:
@@ -403,6 +624,7 @@ class Control:
         if isolated:
             return
         # go through children
+        self.__dirty_children = False
 
         previous_children = self.__previous_children
         current_children = self._get_children()
@@ -417,10 +639,8 @@ class Control:
         for ctrl in current_children:
             hashes[hash(ctrl)] = ctrl
             current_ints.append(hash(ctrl))
-        sm = SequenceMatcher(None, previous_ints, current_ints)
-
         n = 0
-        for tag, a1, a2, b1, b2 in sm.get_opcodes():
+        for tag, a1, a2, b1, b2 in _children_opcodes(previous_ints, current_ints):
             if tag == "delete" or tag == "replace":
                 # deleted controls
 
@@ -459,7 +679,7 @@ class Control:
                             index=index, added_controls=added_controls
                         )
                         assert self.__uid is not None
-                        ctrl.parent = self  # set as parent
+                        self._link_child(ctrl)
                         commands.append(
                             Command(
                                 indent=0,
@@ -474,13 +694,15 @@ class Control:
 
                 for h in previous_ints[a1:a2]:
                     ctrl = hashes[h]
-                    ctrl.build_update_commands(
-                        index,
-                        commands,
-                        added_controls,
-                        removed_controls,
-                        isolated=ctrl.is_isolated(),
-                    )
+                    if not dirty_only or ctrl._needs_update():
+                        ctrl.build_update_commands(
+                            index,
+                            commands,
+                            added_controls,
+                            removed_controls,
+                            isolated=ctrl.is_isolated(),
+                            dirty_only=dirty_only,
+                        )
                     n += 1
             elif tag == "insert":
                 # add
@@ -491,7 +713,7 @@ class Control:
                         index=index, added_controls=added_controls
                     )
                     assert self.__uid is not None
-                    ctrl.parent = self  # set as parent
+                    self._link_child(ctrl)
                     commands.append(
                         Command(
                             indent=0,
@@ -523,6 +745,8 @@ class Control:
     ) -> List[Command]:
         if index:
             self.page = index["page"]
+        self.__dirty = False
+        self.__dirty_children = False
         self.build()
 
         # remove control from index
@@ -546,7 +770,7 @@ class Control:
                 indent=indent + 2, index=index, added_controls=added_controls
             )
             commands.extend(childCmd)
-            control.parent = self  # set as parent
+            self._link_child(control)
         self.__previous_children.clear()
         self.__previous_children.extend(children)
 
@@ -593,6 +817,17 @@ class Control:
         self.__event_handlers.clear()
 
     # Magic methods
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _UNTRACKED_ATTRS:
+            object.__setattr__(self, name, value)
+            return
+        if type(value) is list:
+            value = _ControlList(value, self)
+        object.__setattr__(self, name, value)
+        # property setters flag the control themselves, and only on actual changes
+        if not isinstance(getattr(type(self), name, None), property):
+            self._mark_dirty()
+
     def __str__(self) -> str:
         attrs = {}
         for k, v in self.__attrs.items():
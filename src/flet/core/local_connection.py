@@ -82,7 +82,7 @@ class LocalConnection(Connection):
         )
 
     def _process_command(self, command: Command):
-        logger.debug(f"_process_command: {command}")
+        logger.debug("_process_command: %s", command)
         if command.name == "get":
             return self._process_get_command(command.values)
         elif command.name == "add":
@@ -566,6 +566,10 @@ class Page(AdaptiveControl):
         self._index = {self._Control__uid: self}  # index with all page controls
 
         self.__lock = threading.Lock() if not is_pyodide() else NopeLock()
+        self.__scheduled_lock = threading.Lock() if not is_pyodide() else NopeLock()
+        self.__scheduled_controls: Dict[int, Control] = {}
+        self.__scheduled_page = False
+        self.__update_scheduled = False
 
         self.__views = [View()]
         self.__default_view = self.__views[0]
@@ -735,12 +739,47 @@ class Page(AdaptiveControl):
                 r = self.__update(self)
             else:
                 r = self.__update(*controls)
+        self.__wait_for_send_capacity()
         self.__handle_mount_unmount(*r)
 
+    def schedule_update(self, *controls: Control) -> None:
+        """
+        Non-blocking variant of `update()` which can be called from any thread.
+
+        The update runs on the page's event loop; all updates requested until then
+        are sent together. Without controls the changed controls of the page are sent.
+        """
+        with self.__scheduled_lock:
+            if controls:
+                for control in controls:
+                    self.__scheduled_controls[id(control)] = control
+            else:
+                self.__scheduled_page = True
+            if self.__update_scheduled:
+                return
+            self.__update_scheduled = True
+        self.__loop.call_soon_threadsafe(self.__run_scheduled_update)
+
+    def __run_scheduled_update(self) -> None:
+        with self.__scheduled_lock:
+            controls = list(self.__scheduled_controls.values())
+            if self.__scheduled_page:
+                controls.insert(0, self)
+            self.__scheduled_controls.clear()
+            self.__scheduled_page = False
+            self.__update_scheduled = False
+        try:
+            self.update(*controls)
+        except PageDisconnectedException:
+            logger.debug("Page disconnected, scheduled update dropped")
+        except Exception:
+            logger.exception("Scheduled page update failed")
+
     def add(self, *controls: Control) -> None:
         with self.__lock:
             self._controls.extend(controls)
             r = self.__update(self)
+        self.__wait_for_send_capacity()
         self.__handle_mount_unmount(*r)
 
     def insert(self, at: int, *controls: Control) -> None:
@@ -750,6 +789,7 @@ class Page(AdaptiveControl):
                 self._controls.insert(n, control)
                 n += 1
             r = self.__update(self)
+        self.__wait_for_send_capacity()
         self.__handle_mount_unmount(*r)
 
     def remove(self, *controls: Control) -> None:
@@ -757,12 +797,14 @@ class Page(AdaptiveControl):
             for control in controls:
                 self._controls.remove(control)
             r = self.__update(self)
+        self.__wait_for_send_capacity()
         self.__handle_mount_unmount(*r)
 
     def remove_at(self, index: int) -> None:
         with self.__lock:
             self._controls.pop(index)
             r = self.__update(self)
+        self.__wait_for_send_capacity()
         self.__handle_mount_unmount(*r)
 
     def clean(self) -> None:
@@ -804,6 +846,13 @@ class Page(AdaptiveControl):
         self.__update_control_ids(added_controls, results)
         return added_controls, removed_controls
 
+    def __wait_for_send_capacity(self) -> None:
+        # backpressure is applied after the page lock is released, so that updates
+        # from the event loop keep going and the queue can drain
+        conn = self.__conn
+        if conn:
+            conn.wait_for_send_capacity()
+
     def __prepare_update(
         self, *controls: Control
     ) -> Tuple[List[Any], List[Control], List[Control]]:
@@ -812,10 +861,15 @@ class Page(AdaptiveControl):
         commands = []
 
         # build commands
+        # (a page-wide update only visits the controls changed since the last update)
 
         for control in controls:
             control.build_update_commands(
-                self._index, commands, added_controls, removed_controls
+                self._index,
+                commands,
+                added_controls,
+                removed_controls,
+                dirty_only=control is self,
             )
         return commands, added_controls, removed_controls
 
@@ -841,8 +895,12 @@ class Page(AdaptiveControl):
                     n += 1
 
     def __handle_mount_unmount(self, added_controls, removed_controls) -> None:
+        # controls moved within the same update are removed and re-added
+        readded = {id(ctrl) for ctrl in added_controls}
         for ctrl in removed_controls:
             ctrl.will_unmount()
+            if id(ctrl) in readded:
+                continue
             ctrl.parent = None  # remove parent reference
             ctrl.page = None
         for ctrl in added_controls:
@@ -5,9 +5,11 @@ import os
 import struct
 import sys
 import tempfile
+import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional, Set
 
 import flet
 from flet.core.local_connection import LocalConnection
@@ -19,6 +21,7 @@ from flet.core.protocol import (
     PageCommandResponsePayload,
     PageCommandsBatchResponsePayload,
     RegisterWebClientRequestPayload,
+    UpdateControlPropsPayload,
 )
 from flet.core.pubsub.pubsub_hub import PubSubHub
 from flet.utils import get_free_tcp_port, is_windows, random_string
@@ -26,6 +29,39 @@ from flet.utils import get_free_tcp_port, is_windows, random_string
 logger = logging.getLogger(flet.__name__)
 
 
+def _drop_superseded(messages: List[ClientMessage]) -> List[ClientMessage]:
+    """
+    Removes control props which are overwritten by a later message in the same
+    queue, e.g. intermediate progress values. Everything else is kept in order.
+    """
+    seen: Dict[str, Set[str]] = {}
+
+    def compact(message: ClientMessage) -> Optional[ClientMessage]:
+        if message.action == ClientActions.PAGE_CONTROLS_BATCH:
+            batch = [m for m in map(compact, reversed(message.payload)) if m]
+            if not batch:
+                return None
+            batch.reverse()
+            return ClientMessage(message.action, batch)
+        if message.action != ClientActions.UPDATE_CONTROL_PROPS:
+            return message
+        props = []
+        for p in reversed(message.payload.props):
+            later = seen.setdefault(p["i"], set())
+            remaining = {k: v for k, v in p.items() if k == "i" or k not in later}
+            later.update(p)
+            if len(remaining) > 1:
+                props.append(remaining)
+        if not props:
+            return None
+        props.reverse()
+        return ClientMessage(message.action, UpdateControlPropsPayload(props=props))
+
+    result = [m for m in map(compact, reversed(messages)) if m]
+    result.reverse()
+    return result
+
+
 class FletSocketServer(LocalConnection):
     def __init__(
         self,
@@ -36,9 +72,17 @@ class FletSocketServer(LocalConnection):
         on_session_created=None,
         blocking=False,
         executor: Optional[ThreadPoolExecutor] = None,
+        max_queued_messages: int = 256,
     ):
         super().__init__()
-        self.__send_queue = asyncio.Queue()
+        # messages are compacted, encoded and written by the send loop, in batches;
+        # queueing never blocks, senders wait for capacity in wait_for_send_capacity()
+        self.__send_queue: Deque[ClientMessage] = deque()
+        self.__send_lock = threading.Condition()
+        self.__send_event = asyncio.Event()
+        self.__send_pending = False
+        self.__sending = False
+        self.__max_queued_messages = max_queued_messages
         self.__port = port
         self.__uds_path = uds_path
         self.__on_event = on_event
@@ -104,21 +148,54 @@ class FletSocketServer(LocalConnection):
             await self.__on_message(data.decode("utf-8"))
 
     async def __send_loop(self, writer: asyncio.StreamWriter):
-        while True:
-            message = await self.__send_queue.get()
-            try:
-                data = message.encode("utf-8")
-                msg = struct.pack(">I", len(data)) + data
-                writer.write(msg)
-                # await writer.drain()
-                logger.debug(f"sent to TCP: {len(msg)}")
-            except Exception:
-                # re-enqueue the message to repeat it when re-connected
-                self.__send_queue.put_nowait(message)
-                raise
+        with self.__send_lock:
+            self.__sending = True
+        try:
+            while True:
+                await self.__send_batch(writer)
+        finally:
+            with self.__send_lock:
+                # nobody drains the queue until the client reconnects
+                self.__sending = False
+                self.__send_lock.notify_all()
+
+    async def __send_batch(self, writer: asyncio.StreamWriter):
+        await self.__send_event.wait()
+        self.__send_event.clear()
+        with self.__send_lock:
+            queued = list(self.__send_queue)
+            self.__send_queue.clear()
+            self.__send_pending = False
+            self.__send_lock.notify_all()
+        # superseded props are dropped once per batch, outside of the lock
+        messages = _drop_superseded(queued)
+        if not messages:
+            return
+        try:
+            # everything queued so far goes out with a single write
+            frames = []
+            for message in messages:
+                data = json.dumps(
+                    message, cls=CommandEncoder, separators=(",", ":")
+                ).encode("utf-8")
+                logger.debug("__send: %s", data)
+                frames.append(struct.pack(">I", len(data)))
+                frames.append(data)
+            msg = b"".join(frames)
+            writer.write(msg)
+            # wait while the client can't keep up, meanwhile senders fill the queue
+            # up to max_queued_messages
+            await writer.drain()
+            logger.debug("sent to TCP: %s bytes, %s messages", len(msg), len(messages))
+        except Exception:
+            # re-enqueue the messages to repeat them when re-connected
+            with self.__send_lock:
+                self.__send_queue.extendleft(reversed(messages))
+            self.__send_event.set()
+            raise
 
     async def __on_message(self, data: str):
-        logger.debug(f"_on_message: {data}")
+        logger.debug("_on_message: %s", data)
         msg_dict = json.loads(data)
         msg = ClientMessage(**msg_dict)
         task = None
@@ -173,9 +250,30 @@ class FletSocketServer(LocalConnection):
         return PageCommandsBatchResponsePayload(results=results, error="")
 
     def __send(self, message: ClientMessage):
-        j = json.dumps(message, cls=CommandEncoder, separators=(",", ":"))
-        logger.debug(f"__send: {j}")
-        self.__loop.call_soon_threadsafe(self.__send_queue.put_nowait, j)
+        # called under the page lock: waiting here would stall every page update
+        # on the event loop, and with it the send loop
+        with self.__send_lock:
+            self.__send_queue.append(message)
+            if self.__send_pending:
+                return
+            self.__send_pending = True
+        self.__loop.call_soon_threadsafe(self.__send_event.set)
+
+    def wait_for_send_capacity(self):
+        # backpressure for threads other than the loop, which can't wait for its own send loop
+        if self.__in_loop_thread():
+            return
+        with self.__send_lock:
+            self.__send_lock.wait_for(
+                lambda: len(self.__send_queue) < self.__max_queued_messages
+                or not self.__sending
+            )
+
+    def __in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
 
     async def close(self):
         logger.debug("Closing connection...")
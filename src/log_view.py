@@ -0,0 +1,123 @@
+# Python
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, List, Tuple
+
+import flet as ft
+
+"""
+Log-Ansicht für yt-dlp.
+- Einträge landen in einem Ringpuffer fester Größe (alte Zeilen fallen raus)
+- Controls gibt es nur für das sichtbare Fenster (die letzten window Zeilen), sie werden wiederverwendet
+- gerendert wird nur bei offenem Dialog und höchstens hz mal pro Sekunde
+"""
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+_LEVEL_STYLE = {
+    "DEBUG": ("", ft.Colors.GREY),
+    "INFO": ("", None),
+    "WARNING": ("WARNING: ", ft.Colors.ORANGE),
+    "ERROR": ("ERROR: ", ft.Colors.RED),
+}
+
+
+class LogView:
+    """
+    Ringpuffer + Fenster-Rendering. Ist gleichzeitig der Logger für yt-dlp (debug, info, warning, error).
+    """
+
+    def __init__(self, page: ft.Page, capacity: int = 5000, window: int = 200, hz: float = 4.0):
+        self.page = page
+        self.window = window
+        self.interval = 1.0 / hz
+        self.min_level = "DEBUG"
+        self.visible = False
+
+        self._lock = threading.Lock()
+        self._entries: Deque[Tuple[str, str]] = deque(maxlen=capacity)
+        self._dirty = False
+        self._task = None
+
+        self._lines: List[ft.Text] = []
+        self.column = ft.Column(scroll=ft.ScrollMode.AUTO, expand=True, auto_scroll=True)
+
+    # yt-dlp Logger-Schnittstelle
+    def debug(self, msg):
+        # yt-dlp schickt sowohl "debug" als auch "info" hierher
+        if msg.startswith("[debug] "):
+            self._append("DEBUG", msg)
+        else:
+            self.info(msg)
+
+    def info(self, msg):
+        self._append("INFO", msg)
+
+    def warning(self, msg):
+        self._append("WARNING", msg)
+
+    def error(self, msg):
+        self._append("ERROR", msg)
+
+    # Steuerung durch die View
+    def start(self) -> None:
+        if self._task is None:
+            self._task = self.page.run_task(self._run)
+
+    def set_visible(self, visible: bool) -> None:
+        self.visible = visible
+        if visible:
+            self._dirty = True
+
+    def set_level(self, level: str) -> None:
+        if level in LEVELS:
+            self.min_level = level
+            self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def render(self) -> None:
+        """
+        Überträgt die letzten window (gefilterten) Einträge in die wiederverwendeten Text-Controls.
+        """
+        with self._lock:
+            self._dirty = False
+            min_index = LEVELS.index(self.min_level)
+            visible: List[Tuple[str, str]] = []
+            for entry in reversed(self._entries):
+                if LEVELS.index(entry[0]) >= min_index:
+                    visible.append(entry)
+                    if len(visible) >= self.window:
+                        break
+        visible.reverse()
+
+        while len(self._lines) < len(visible):
+            self._lines.append(ft.Text(""))
+        for line, (level, msg) in zip(self._lines, visible):
+            prefix, color = _LEVEL_STYLE[level]
+            line.value = prefix + msg
+            line.color = color
+        self.column.controls = self._lines[: len(visible)]
+
+        try:
+            self.page.update(self.column)
+        except Exception:
+            pass
+
+    # Hilfsfunktionen
+    def _append(self, level: str, msg: str) -> None:
+        with self._lock:
+            self._entries.append((level, msg))
+            self._dirty = True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if self.visible and self._dirty:
+                self.render()
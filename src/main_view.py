@@ -7,8 +7,18 @@ import flet as ft
 from urllib.parse import urlparse
 from soundcloud_resolver import _is_soundcloud_url as validate_url
 import download_controller as dc
+from progress_aggregator import ProgressAggregator
+from download_list import DownloadList
+from log_view import LogView, LEVELS as LOG_LEVELS
 dc = dc.DownloadController(base_dir="auto")
 
+# Weg der Nachbearbeitung, wird nach Abschluss an den Untertitel gehängt
+_CONVERSION_LABELS = {
+    "KEEP": "unverändert",
+    "REMUX": "nur Container gewechselt",
+    "TRANSCODE": "umkodiert",
+}
+
 
 
 
@@ -69,34 +79,18 @@ def main(page: ft.Page):
     page.window_min_height = 600
 
     page.appbar = ft.AppBar(title=ft.Text("Downloads"), center_title=False) #Appbar Initialisieren
-    lv = ft.ListView(expand=True, spacing=8, padding=12, auto_scroll=True) #Listview mit Download Items
-
 
-    log_output = ft.Column(scroll=ft.ScrollMode.AUTO, expand=True)
-    class DownloadLogger:
-        """
-        Klasse für download logging: yt-dlp erwartet ein Objekt mit 4 Funktionen (debug, info, warning, error)
-        """
-        def debug(self, msg):
-            # yt-dlp schickt sowohl "debug" als auch "info" hierher
-            if msg.startswith("[debug] "):
-                log_output.controls.append(ft.Text(msg, color=ft.Colors.GREY))
-            else:
-                self.info(msg)
-            page.update()
+    # Progress/Status-Updates werden gesammelt und max. 10x pro Sekunde gebündelt gesendet
+    ui_updates = ProgressAggregator(page, hz=10)
+    ui_updates.start()
 
-        def info(self, msg):
-            log_output.controls.append(ft.Text(msg))
-            page.update()
+    # Download Items: Zeilenmodell pro Item, Kacheln nur für den sichtbaren Bereich
+    downloads = DownloadList(page, ui_updates)
 
-        def warning(self, msg):
-            log_output.controls.append(ft.Text(f"WARNING: {msg}", color=ft.Colors.ORANGE))
-            page.update()
 
-        def error(self, msg):
-            log_output.controls.append(ft.Text(f"ERROR: {msg}", color=ft.Colors.RED))
-            page.update()
-    log = DownloadLogger()
+    # yt-dlp Log: Ringpuffer, gerendert wird nur das sichtbare Fenster bei offenem Dialog
+    log = LogView(page, capacity=5000, window=200, hz=4)
+    log.start()
 
     # URL input Dialog
     url_field = ft.TextField(label="Download-Link einfügen", autofocus=True, multiline=False, width=500)
@@ -113,13 +107,28 @@ def main(page: ft.Page):
 
 
     def show_log():
+        def close_log(e):
+            log.set_visible(False)
+            page.close(log_dialog)
+
+        level_dropdown = ft.Dropdown(
+            value=log.min_level,
+            options=[ft.dropdown.Option(level) for level in LOG_LEVELS],
+            on_change=lambda e: log.set_level(e.control.value),
+            width=150,
+        )
         log_dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("yt-dlp Log"),
-            content=log_output,
-            actions=[ft.ElevatedButton("Close", on_click=lambda e: page.close(log_dialog))]
+            content=log.column,
+            actions=[
+                level_dropdown,
+                ft.TextButton("Leeren", on_click=lambda e: log.clear()),
+                ft.ElevatedButton("Close", on_click=close_log),
+            ]
         )
         page.open(log_dialog)
+        log.set_visible(True)
 
     def show_debug_info():
         import os
@@ -152,6 +161,23 @@ def main(page: ft.Page):
 
         debug_text.append(f"ffmpeg Executable: {os.access("/data/data/com.flet.src/files/flet/app/ffmpeg", os.X_OK)}")
 
+        # Adaptive Parallelität und Pipeline
+        adaptive = dc.adaptive.stats()
+        debug_text.append("\nParallelität (adaptiv):")
+        debug_text.append(f"Downloads: {adaptive['downloads']}, Fragment-Worker: {adaptive['fragments']}")
+        debug_text.append(f"Durchsatz: {adaptive['throughput_kib']} KiB/s")
+        for host, ms in sorted(adaptive["latency_ms"].items()):
+            debug_text.append(f"Latenz {host}: {ms} ms")
+        for name, stage in dc.pipeline_stats().items():
+            debug_text.append(f"{name}: {stage['active']}/{stage['limit']} aktiv, {stage['queued']} wartend")
+        debug_text.extend(adaptive["decisions"][-10:] or ["(noch keine Anpassung)"])
+        cache = dc.resolve_cache.stats()
+        debug_text.append("\nResolve-Cache:")
+        debug_text.append(f"{cache['entries']} Tracks, {cache['size_kib']} KiB ({cache['path']})")
+        debug_text.append(f"Treffer: {cache['hits']}, neu zu signieren: {cache['stale_streams']}, verfehlt: {cache['misses']}")
+        rows = downloads.stats()
+        debug_text.append(f"\nListe: {rows['rows']} Einträge, {rows['tiles']} Kacheln (ab Zeile {rows['first']})")
+
         debug_info = "\n".join(debug_text)
 
         def close_debug(e):
@@ -203,26 +229,27 @@ def main(page: ft.Page):
             close_dialog()
             return
 
-        # UI-Elemente erstellen
-        title_text = ft.Text("Lade Metadaten...", weight=ft.FontWeight.W_600)
-        subtitle_text = ft.Text(url, color=ft.Colors.GREY_700, size=12, max_lines=2, overflow=ft.TextOverflow.ELLIPSIS)
-        avatar = ft.CircleAvatar(radius=24, foreground_image_src=None, bgcolor=ft.Colors.GREY_200,
-                                 content=ft.Icon(ft.Icons.AUDIO_FILE))
-        status_chip = ft.Chip(label=ft.Text("Ausstehend"), leading=ft.Icon(ft.Icons.DOWNLOAD),
-                              bgcolor=ft.Colors.GREY_200)
-        progress_bar = ft.ProgressBar(value=0.0, width=220)
-
-        item_tile = ft.ListTile(
-            leading=avatar,
-            title=title_text,
-            subtitle=ft.Column([subtitle_text, progress_bar], spacing=4, tight=True),
-            trailing=status_chip,
-            dense=False,
-        )
-        lv.controls.append(item_tile)
+        on_progress, on_status, item_ref = create_tile(url)
         page.update()
         close_dialog()
 
+        def on_entry(child):
+            # Track aus einem Set/User/Likes: eigene Kachel, gesendet wird mit dem nächsten Tick
+            child_progress, child_status, child_ref = create_tile(child.title or child.url)
+            child_ref["it"] = child
+            child.on_progress = child_progress
+            child.on_status_change = child_status
+
+        download_item = dc.add_link(url, on_progress=on_progress, on_status=on_status, log=log, on_entry=on_entry)
+        item_ref["it"] = download_item
+
+    def create_tile(label: str):
+        """
+        Legt die Zeile für ein DownloadItem an und gibt (on_progress, on_status, item_ref) zurück.
+        Eine Kachel dazu gibt es nur, solange die Zeile im sichtbaren Bereich liegt.
+        """
+        row = downloads.add(label)
+
         #Platzhalter für DownloadItem
         item_ref = {"it": None}
 
@@ -236,47 +263,39 @@ def main(page: ft.Page):
                 content=ft.Text(error_message),
                 actions=[ft.TextButton("OK", on_click=close_alert)]
             )
-            page.dialog = alert
-            page.open(alert)
-            page.update()
+            # on_status kann aus einem Worker-Thread kommen: nicht auf die UI warten
+            alert.open = True
+            page.overlay.append(alert)
+            page.schedule_update()
 
         def on_status(status, err, *, page=page):
+            # Icon/Farben des Chips kommen aus dem Status (download_list._STATUS_STYLE)
             it = item_ref["it"]
             if it and it.title:
-                title_text.value = it.title,
+                row.title = it.title
             if it and it.image_url:
-                avatar.foreground_image_src = it.image_url
-                avatar.content = None
-            status_chip.label = ft.Text(status.name)
-            if status.name == "READY":
-                status_chip.leading = ft.Icon(ft.Icons.CHECK_CIRCLE, color=ft.Colors.GREEN)
-                status_chip.bgcolor = ft.Colors.GREEN_50
-            elif status.name == "DOWNLOADING":
-                status_chip.leading = ft.Icon(ft.Icons.DOWNLOAD)
-                status_chip.bgcolor = ft.Colors.GREY_200
-            elif status.name == "COMPLETED":
-                status_chip.leading = ft.Icon(ft.Icons.CHECK, color=ft.Colors.GREEN)
-                status_chip.bgcolor = ft.Colors.GREEN_50
+                row.image_url = it.image_url
+            row.status = status.name
+            if status.name == "COMPLETED":
+                if it and it.conversion:
+                    row.subtitle = f"{row.subtitle} · {_CONVERSION_LABELS[it.conversion.name]}"
             elif status.name == "FAILED":
-                status_chip.leading = ft.Icon(ft.Icons.ERROR, color=ft.Colors.RED)
-                status_chip.bgcolor = ft.Colors.RED_50
                 if err:
-                    subtitle_text.value = f"{subtitle_text.value}\n{err}"
+                    row.subtitle = f"{row.subtitle}\n{err}"
                     show_error_alert(err)
-            page.update()
+            downloads.changed(row)
 
 
 
         def on_progress(d: dict, *, page=page):
             p = float(d.get("progress") or 0.0)
-            progress_bar.value = p
+            row.progress = p
             spd = d.get("speed") or 0
             eta = d.get("eta")
-            subtitle_text.value = f"{int(p * 100)}% • {int(spd / 1024)} KiB/s" + (f" • ETA {eta}s" if eta else "")
-            page.update()
+            row.subtitle = f"{int(p * 100)}% • {int(spd / 1024)} KiB/s" + (f" • ETA {eta}s" if eta else "")
+            downloads.changed(row)
 
-        download_item = dc.add_link(url, on_progress=on_progress, on_status=on_status, log=log)
-        item_ref["it"] = download_item
+        return on_progress, on_status, item_ref
 
     # FAB unten rechts
     page.floating_action_button = ft.FloatingActionButton(
@@ -286,7 +305,7 @@ def main(page: ft.Page):
     )
 
     # Content
-    page.add(ft.SafeArea(ft.Container(lv, expand=True)))
+    page.add(ft.SafeArea(ft.Container(downloads.list_view, expand=True)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+# Python
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Generic, Optional, Set, TypeVar
+
+"""
+Mehrstufige Pipeline für den DownloadController.
+- jede Stufe (resolve, fetch, postprocess) hat ihre eigene Warteschlange und ihr eigenes Limit
+- der Handler einer Stufe gibt True zurück, wenn der Job an die nächste Stufe weitergeht
+- Gegendruck: eine Stufe startet keine neuen Jobs, solange in der nächsten Stufe zu viele warten
+- Limits können zur Laufzeit geändert werden (set_limit)
+"""
+
+T = TypeVar("T")
+Handler = Callable[[T], Awaitable[bool]]
+
+
+class Stage(Generic[T]):
+    """
+    Eine Stufe der Pipeline. Statt fester Worker wird pro Job ein Task gestartet,
+    solange weniger als limit Jobs aktiv sind.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Handler,
+        limit: int,
+        next_stage: Optional["Stage[T]"] = None,
+        max_backlog: Optional[int] = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.limit = max(1, limit)
+        self.next_stage = next_stage
+        # max. wartende Jobs in der nächsten Stufe, bevor diese Stufe pausiert (None = unbegrenzt)
+        self.max_backlog = max_backlog
+
+        self._pending: Deque[T] = deque()
+        self._active: Set[asyncio.Task] = set()
+        self._upstream: Optional["Stage[T]"] = None
+        if next_stage is not None:
+            next_stage._upstream = self
+
+        # Statistik für Debug-Dialog
+        self.started = 0
+        self.finished = 0
+
+    def put(self, job: T) -> None:
+        self._pending.append(job)
+        self._pump()
+
+    def set_limit(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self._pump()
+
+    @property
+    def active(self) -> int:
+        return len(self._active)
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self.queued,
+            "finished": self.finished,
+        }
+
+    # Hilfsfunktionen
+    def _blocked(self) -> bool:
+        nxt = self.next_stage
+        return nxt is not None and self.max_backlog is not None and nxt.queued >= self.max_backlog
+
+    def _pump(self) -> None:
+        started = False
+        while self._pending and len(self._active) < self.limit and not self._blocked():
+            job = self._pending.popleft()
+            task = asyncio.get_running_loop().create_task(self._run(job))
+            self._active.add(task)
+            self.started += 1
+            started = True
+        # die vorherige Stufe wartet evtl. darauf, dass hier Platz in der Warteschlange frei wird
+        if started and self._upstream is not None:
+            self._upstream._pump()
+
+    async def _run(self, job: T) -> None:
+        forward = False
+        try:
+            forward = await self.handler(job)
+        finally:
+            self._active.discard(asyncio.current_task())
+            self.finished += 1
+            if forward and self.next_stage is not None:
+                self.next_stage.put(job)
+            self._pump()
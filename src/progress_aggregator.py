@@ -0,0 +1,63 @@
+# Python
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Dict
+
+import flet as ft
+
+"""
+Bündelt UI-Updates aus den Download-Threads.
+- Hooks markieren nur geänderte Controls als "dirty"
+- ein Tick (Standard 10 Hz) schickt pro Durchlauf genau ein page.update(*controls)
+"""
+
+
+class ProgressAggregator:
+    """
+    Rate-limitierte Sammelstelle für geänderte Controls. mark_dirty ist thread-safe
+    und kann direkt aus den yt-dlp Progress-Hooks aufgerufen werden.
+    """
+
+    def __init__(self, page: ft.Page, hz: float = 10.0):
+        self.page = page
+        self.interval = 1.0 / hz
+        self._lock = threading.Lock()
+        # dict statt set, damit die Reihenfolge der Updates erhalten bleibt
+        self._dirty: Dict[int, ft.Control] = {}
+        self._task = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = self.page.run_task(self._run)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def mark_dirty(self, *controls: ft.Control) -> None:
+        with self._lock:
+            for control in controls:
+                self._dirty[id(control)] = control
+
+    def flush(self) -> None:
+        """
+        Schickt alle geänderten Controls in einem einzigen Update.
+        """
+        with self._lock:
+            controls = list(self._dirty.values())
+            self._dirty.clear()
+        if not controls:
+            return
+        try:
+            self.page.update(*controls)
+        except Exception:
+            # Seite getrennt o.ä.: nicht den Tick abbrechen
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
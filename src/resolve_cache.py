@@ -0,0 +1,319 @@
+# Python
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from yt_dlp.cache import Cache
+from yt_dlp.version import __version__ as YTDLP_VERSION
+
+"""
+Persistenter Resolve-Cache (SQLite) neben den JSON-Sektionen von yt_dlp.cache.Cache.
+- Schlüssel: kanonische SoundCloud-URL -> Track-ID -> Eintrag
+- stabile Metadaten (Titel, Uploader, Artwork, Dauer, Transcodings) bleiben lange gültig (info_ttl)
+- signierte Stream-URLs haben eine eigene, kurze Gültigkeit (stream_ttl, höchstens bis zu ihrem Expires)
+- abgelaufene Stream-URLs: die Formate behalten ihren url_resolver, yt-dlp holt beim Download
+  nur die URL des gewählten Formats neu (eine API-Anfrage statt eines kompletten Resolves)
+- Größenlimit: die am längsten nicht benutzten Einträge fliegen zuerst raus
+"""
+
+SECTION = "resolve"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+    track_id TEXT PRIMARY KEY,
+    title TEXT,
+    uploader TEXT,
+    duration REAL,
+    version TEXT NOT NULL,
+    info TEXT NOT NULL,
+    streams TEXT,
+    info_expires REAL NOT NULL,
+    streams_expires REAL NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    track_id TEXT NOT NULL REFERENCES tracks(track_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS tracks_last_used ON tracks(last_used);
+CREATE INDEX IF NOT EXISTS urls_track_id ON urls(track_id);
+"""
+
+# Abfrage-Parameter, die einen anderen Track meinen (alles andere, z.B. si/utm_*, wird verworfen)
+_KEEP_QUERY = ("secret_token",)
+
+
+def default_path(cachedir: Optional[str] = None) -> str:
+    return os.path.join(Cache.root_dir(cachedir), SECTION, "tracks.sqlite")
+
+
+def canonical_url(url: str) -> str:
+    """
+    https://m.soundcloud.com/artist/track/?si=...  ->  https://soundcloud.com/artist/track
+    Der Pfad bleibt wie er ist, private Tracks tragen ihr (case-sensitives) Token darin.
+    """
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parsed.path.rstrip("/") or "/"
+    query = {key: value for key, value in parse_qs(parsed.query).items() if key in _KEEP_QUERY}
+    canonical = f"https://{host}{path}"
+    if query:
+        canonical += "?" + urlencode(sorted(query.items()), doseq=True)
+    return canonical
+
+
+def _url_expiry(url: str) -> Optional[float]:
+    # CloudFront/S3-Signaturen tragen ihr Ablaufdatum in der URL
+    query = parse_qs(urlparse(url).query)
+    for key in ("Expires", "expires"):
+        try:
+            return float(query[key][0])
+        except (KeyError, IndexError, ValueError):
+            continue
+    return None
+
+
+class ResolveCache:
+    """
+    Thread-safe (eine Verbindung, ein Lock), get/put werden aus den asyncio.to_thread Workern aufgerufen.
+    path=None: kein Cache, alle Aufrufe sind No-Ops.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "",
+        info_ttl: float = 30 * 24 * 3600,
+        stream_ttl: float = 10 * 60,
+        stream_margin: float = 60,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entries: int = 5000,
+    ):
+        self.path = default_path() if path == "" else path
+        self.info_ttl = info_ttl
+        self.stream_ttl = stream_ttl
+        self.stream_margin = stream_margin
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        # Statistik für Debug-Dialog
+        self.hits = 0
+        self.stale_streams = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    # Abfragen
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        info dict für die URL oder None. Sind die signierten Stream-URLs abgelaufen,
+        kommen die Formate mit url_resolver zurück und werden erst beim Download neu signiert.
+        """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return None
+            row = db.execute(
+                "SELECT t.track_id, t.version, t.info, t.streams, t.info_expires, t.streams_expires"
+                " FROM urls u JOIN tracks t ON t.track_id = u.track_id WHERE u.url = ?",
+                (canonical_url(url),),
+            ).fetchone()
+            now = time.time()
+            if row is None or row[1] != YTDLP_VERSION or row[4] <= now:
+                self.misses += 1
+                return None
+            db.execute("UPDATE tracks SET last_used = ? WHERE track_id = ?", (now, row[0]))
+            db.commit()
+
+        info = json.loads(row[2])
+        if row[3] and row[5] > now:
+            self.hits += 1
+            _apply_streams(info, json.loads(row[3]))
+        else:
+            self.stale_streams += 1
+        return info
+
+    def search(self, text: str = "", limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Gecachte Tracks, deren Titel oder Uploader text enthält (zuletzt benutzte zuerst).
+        """
+        pattern = f"%{text}%"
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return []
+            rows = db.execute(
+                "SELECT track_id, title, uploader, duration, last_used FROM tracks"
+                " WHERE title LIKE ? OR uploader LIKE ? ORDER BY last_used DESC LIMIT ?",
+                (pattern, pattern, limit),
+            ).fetchall()
+        keys = ("track_id", "title", "uploader", "duration", "last_used")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            db = self._connect()
+            entries, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tracks").fetchone() if db else (0, 0)
+        return {
+            "path": self.path,
+            "entries": entries,
+            "size_kib": round(size / 1024),
+            "hits": self.hits,
+            "stale_streams": self.stale_streams,
+            "misses": self.misses,
+        }
+
+    # Schreiben
+    def put(self, url: str, info: Dict[str, Any], resolvers: Dict[str, Dict[str, str]]) -> None:
+        """
+        info: verarbeitetes, bereinigtes info dict (sanitize_info)
+        resolvers: format_id -> {"url": Transcoding-URL, "url_resolver": ie_key} aus dem unverarbeiteten Ergebnis,
+                   damit die signierten URLs wieder durch ihre (stabile) Referenz ersetzt werden können
+        """
+        track_id = info.get("id")
+        if not track_id or not self.enabled:
+            return
+        stable, streams = _split_streams(info, resolvers)
+        now = time.time()
+        streams_expires = now + self.stream_ttl
+        for stream in streams.values():
+            expiry = _url_expiry(stream["url"])
+            if expiry is not None:
+                streams_expires = min(streams_expires, expiry - self.stream_margin)
+
+        info_json = json.dumps(stable, ensure_ascii=False)
+        streams_json = json.dumps(streams, ensure_ascii=False) if streams else None
+        size = len(info_json) + len(streams_json or "")
+        urls = {canonical_url(url)}
+        if info.get("webpage_url"):
+            urls.add(canonical_url(info["webpage_url"]))
+
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            db.execute(
+                "INSERT OR REPLACE INTO tracks"
+                " (track_id, title, uploader, duration, version, info, streams, info_expires, streams_expires, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(track_id), info.get("title"), info.get("uploader"), info.get("duration"), YTDLP_VERSION,
+                    info_json, streams_json, now + self.info_ttl, streams_expires, size, now,
+                ),
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO urls (url, track_id) VALUES (?, ?)", [(u, str(track_id)) for u in urls])
+            self._evict(db, now)
+            db.commit()
+
+    def drop_streams(self, url: str) -> None:
+        """
+        Verwirft die signierten URLs des Tracks (z.B. nach einem fehlgeschlagenen Download), die Metadaten bleiben.
+        """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            db.execute(
+                "UPDATE tracks SET streams = NULL, streams_expires = 0"
+                " WHERE track_id = (SELECT track_id FROM urls WHERE url = ?)",
+                (canonical_url(url),),
+            )
+            db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            db.execute("DELETE FROM tracks")
+            db.execute("DELETE FROM urls")
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # Hilfsfunktionen
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._db is not None or not self.enabled:
+            return self._db
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA foreign_keys = ON")
+            db.execute("PRAGMA journal_mode = WAL")
+            if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                db.executescript("DROP TABLE IF EXISTS urls; DROP TABLE IF EXISTS tracks;")
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            db.executescript(_SCHEMA)
+        except sqlite3.Error:
+            # kaputte oder nicht beschreibbare Datei: ohne Cache weiterarbeiten
+            self.path = None
+            return None
+        self._db = db
+        return db
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> None:
+        db.execute("DELETE FROM tracks WHERE info_expires <= ? OR version != ?", (now, YTDLP_VERSION))
+        entries, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tracks").fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        # älteste zuerst, bis beide Limits eingehalten sind
+        drop = []
+        for track_id, row_size in db.execute("SELECT track_id, size FROM tracks ORDER BY last_used"):
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            drop.append((track_id,))
+            entries -= 1
+            size -= row_size
+        db.executemany("DELETE FROM tracks WHERE track_id = ?", drop)
+
+
+def _split_streams(info: Dict[str, Any], resolvers: Dict[str, Dict[str, str]]):
+    """
+    Trennt die signierten URLs der aufgelösten Formate vom Rest des info dicts.
+    """
+    stable = dict(info)
+    streams: Dict[str, Dict[str, Any]] = {}
+    formats = []
+    for fmt in info.get("formats") or []:
+        ref = resolvers.get(fmt.get("format_id"))
+        if ref and "url_resolver" not in fmt:
+            streams[fmt["format_id"]] = {"url": fmt["url"], "http_headers": fmt.get("http_headers")}
+            fmt = {**fmt, **ref}
+        formats.append(fmt)
+    if formats:
+        stable["formats"] = formats
+    # vom besten Format übernommene Felder (yt-dlp Kompatibilität) würden eine signierte URL konservieren
+    if stable.get("format_id") in streams:
+        stable["url"] = resolvers[stable["format_id"]]["url"]
+    return stable, streams
+
+
+def _apply_streams(info: Dict[str, Any], streams: Dict[str, Dict[str, Any]]) -> None:
+    for fmt in info.get("formats") or []:
+        stream = streams.get(fmt.get("format_id"))
+        if stream and fmt.get("url_resolver"):
+            fmt["url"] = stream["url"]
+            fmt.pop("url_resolver")
+            if stream.get("http_headers"):
+                fmt["http_headers"] = stream["http_headers"]
+    if info.get("format_id") in streams:
+        info["url"] = streams[info["format_id"]]["url"]
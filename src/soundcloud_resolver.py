@@ -1,10 +1,44 @@
 # Python
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Set
 
 from urllib.parse import urlparse
 import yt_dlp  #pip install yt-dlp
+from yt_dlp.extractor.soundcloud import (
+    SoundcloudPlaylistIE,
+    SoundcloudRelatedIE,
+    SoundcloudSetIE,
+    SoundcloudTrackStationIE,
+    SoundcloudUserIE,
+    SoundcloudUserPermalinkIE,
+)
+
+from resolve_cache import ResolveCache
+from ydl_engine import YdlEngine
+
+# Nur SoundCloud-Extractoren plus generic laden statt ~1800 (spart das Kompilieren
+# hunderter _VALID_URL Regexe beim ersten Resolve)
+ALLOWED_EXTRACTORS = ["soundcloud.*", "generic"]
+
+PROFILE = "resolve"
+YDL_OPTS = {
+    "quiet": True,
+    "nocheckcertificate": True,
+    "skip_download": True,
+    "extract_flat": False,
+    "allowed_extractors": ALLOWED_EXTRACTORS,
+}
+
+# Extractoren für Sammlungen (Sets, User-Seiten, Likes, Reposts, Stations, ...)
+_COLLECTION_IES = (
+    SoundcloudSetIE,
+    SoundcloudUserIE,
+    SoundcloudUserPermalinkIE,
+    SoundcloudRelatedIE,
+    SoundcloudTrackStationIE,
+    SoundcloudPlaylistIE,
+)
 
 
 def _is_soundcloud_url(url: str) -> bool:
@@ -15,36 +49,109 @@ def _is_soundcloud_url(url: str) -> bool:
     return "soundcloud.com" in host
 
 
-def resolve(url: str) -> Dict[str, Optional[str]]:
+def is_collection_url(url: str) -> bool:
+    """
+    True für Set-, User-, Likes-, ... URLs, die der Controller in einzelne Tracks auffächert.
+    """
+    return _is_soundcloud_url(url) and any(ie.suitable(url) for ie in _COLLECTION_IES)
+
+
+def iter_collection(url: str, engine: Optional[YdlEngine] = None) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Listet eine Sammlung flach auf und liefert die Einträge, sobald sie da sind:
+      - url
+      - title (falls die API ihn schon mitliefert)
+      - uploader (falls vorhanden)
+    Die einzelnen Tracks werden hier nicht extrahiert (process=False), das passiert erst beim Download.
+    Paged-Playlists (User, Likes, ...) laden ihre Seiten à 200 Einträge erst beim Iterieren.
+    """
+    if not is_collection_url(url):
+        raise ValueError("Keine SoundCloud-Sammlung")
+
+    if engine is not None:
+        engine.register_profile(PROFILE, YDL_OPTS)
+        with engine.session(PROFILE) as ydl:
+            yield from _flat_entries(ydl, url, set())
+    else:
+        with yt_dlp.YoutubeDL(dict(YDL_OPTS)) as ydl:
+            yield from _flat_entries(ydl, url, set())
+
+
+def resolve(
+    url: str,
+    engine: Optional[YdlEngine] = None,
+    cache: Optional[ResolveCache] = None,
+    format_spec: Optional[str] = None,
+) -> Dict[str, Optional[str]]:
     """
     Gibt dictionary für den Controller zurück:
       - title
       - uploader
       - thumbnail
       - url,
-    bei Playlists wird der erste Eintrag genommen.
+      - info_dict (vollständiges yt-dlp info dict für den Download, keine zweite Extraktion)
+    bei Playlists wird der erste Eintrag genommen (Sammlungs-URLs laufen über iter_collection).
+    Mit engine wird eine warme YoutubeDL-Instanz aus dem Pool benutzt.
+    Mit cache kommen wiederholte Resolves ohne API-Anfrage aus dem ResolveCache.
+    format_spec: dieselbe Format-Auswahl wie beim Download, damit nur dessen Stream-URL signiert wird.
     """
     if not _is_soundcloud_url(url):
         raise ValueError("Ungültige SoundCloud-URL")
 
-    ydl_opts = {
-        "quiet": True,
-        "nocheckcertificate": True,
-        "skip_download": True,
-        "extract_flat": False,
+    info = cache.get(url) if cache is not None else None
+    if info is not None:
+        return _summary(info, url)
+
+    opts = dict(YDL_OPTS)
+    profile = PROFILE
+    if format_spec:
+        # eigenes Profil, sonst würden sich iter_collection und resolve gegenseitig die Instanzen verwerfen
+        opts["format"] = format_spec
+        profile = f"{PROFILE}:{format_spec}"
+
+    if engine is not None:
+        engine.register_profile(profile, opts)
+        with engine.session(profile) as ydl:
+            info = _extract(ydl, url, cache)
+    else:
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            info = _extract(ydl, url, cache)
+
+    if not info:
+        raise RuntimeError("Keine Informationen vom Resolver erhalten")
+    return _summary(info, url)
+
+
+def _extract(ydl: yt_dlp.YoutubeDL, url: str, cache: Optional[ResolveCache] = None) -> Optional[dict]:
+    """
+    extract_info in zwei Schritten, damit die Referenzen der Formate (url_resolver) vor dem
+    Auflösen der signierten URLs für den Cache festgehalten werden können.
+    """
+    raw = ydl.extract_info(url, download=False, process=False)
+    if not raw:
+        return None
+    cacheable = cache is not None and raw.get("_type", "video") == "video"
+    resolvers = {
+        f["format_id"]: {"url": f["url"], "url_resolver": f["url_resolver"]}
+        for f in raw.get("formats") or [] if f.get("url_resolver")
     }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+    info = ydl.process_ie_result(raw, download=False)
 
     # Playlist
     if info and info.get("_type") == "playlist":
         entries = info.get("entries") or []
         if entries:
             info = entries[0]
-
     if not info:
-        raise RuntimeError("Keine Informationen vom Resolver erhalten")
+        return None
+
+    info = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+    if cacheable:
+        cache.put(url, info, resolvers)
+    return info
+
 
+def _summary(info: dict, url: str) -> Dict[str, Optional[str]]:
     title = info.get("title")
     uploader = info.get("uploader") or info.get("artist") or info.get("uploader_id")
     thumbnail = info.get("thumbnail")
@@ -59,6 +166,7 @@ def resolve(url: str) -> Dict[str, Optional[str]]:
         "thumbnail": thumbnail,
         "ext": ext,
         "webpage_url": info.get("webpage_url") or url,
+        "info_dict": info,
     }
 
 
@@ -69,4 +177,27 @@ def _guess_ext_from_formats(info: dict) -> Optional[str]:
         e = f.get("ext")
         if e:
             return e
-    return None
\ No newline at end of file
+    return None
+
+
+def _flat_entries(ydl: yt_dlp.YoutubeDL, url: str, seen: Set[str], depth: int = 0) -> Iterator[Dict[str, Optional[str]]]:
+    info = ydl.extract_info(url, download=False, process=False)
+    if not info:
+        return
+    for entry in info.get("entries") or []:
+        if not entry:
+            continue
+        entry_url = entry.get("url") or entry.get("webpage_url")
+        if not entry_url or entry_url in seen:
+            continue
+        seen.add(entry_url)
+        # User-Streams enthalten auch Sets: eine Ebene tiefer auffächern
+        if is_collection_url(entry_url):
+            if depth < 1:
+                yield from _flat_entries(ydl, entry_url, seen, depth + 1)
+            continue
+        yield {
+            "url": entry_url,
+            "title": entry.get("title"),
+            "uploader": entry.get("uploader"),
+        }
@@ -0,0 +1,152 @@
+# Python
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import yt_dlp  # pip install yt-dlp
+
+"""
+Langlebige, geteilte yt-dlp Engine.
+- hält warme YoutubeDL-Instanzen pro Options-Profil ("resolve", "download", ...)
+- thread-safe, damit asyncio.to_thread Worker parallel Instanzen ausleihen können
+- Progress-Hooks, Logger und outtmpl werden pro Aufruf gesetzt und danach zurückgesetzt
+"""
+
+ProgressHook = Callable[[dict], None]
+
+
+class YdlEngine:
+    """
+    Pool von YoutubeDL-Instanzen. Eine Instanz wird immer nur von einem Thread gleichzeitig benutzt;
+    parallele Aufrufe desselben Profils bekommen eine eigene (ggf. neu gebaute) Instanz.
+    """
+
+    def __init__(self, max_idle_per_profile: int = 4, request_hooks: Iterable[Callable[[dict], None]] = ()):
+        self.max_idle_per_profile = max_idle_per_profile
+        # gehen an jede gebaute Instanz (z.B. Status/Latenz für die adaptive Parallelität)
+        self.request_hooks = list(request_hooks)
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, dict] = {}
+        self._generation: Dict[str, int] = {}
+        self._idle: Dict[str, List[yt_dlp.YoutubeDL]] = {}
+        self._closed = False
+        # Statistik für Debug-Dialog
+        self.created = 0
+        self.reused = 0
+
+    def register_profile(self, name: str, opts: dict) -> None:
+        """
+        Registriert (oder ersetzt) ein Options-Profil. Bei geänderten Optionen werden alte Instanzen verworfen.
+        """
+        with self._lock:
+            if self._profiles.get(name) == opts:
+                return
+            self._profiles[name] = dict(opts)
+            self._generation[name] = self._generation.get(name, 0) + 1
+            stale = self._idle.pop(name, [])
+        for ydl in stale:
+            self._close_quietly(ydl)
+
+    def has_profile(self, name: str) -> bool:
+        with self._lock:
+            return name in self._profiles
+
+    @contextmanager
+    def session(
+        self,
+        profile: str,
+        *,
+        progress_hooks: Iterable[ProgressHook] = (),
+        logger: Optional[object] = None,
+        outtmpl: Optional[str] = None,
+        overrides: Optional[dict] = None,
+    ) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Leiht eine warme YoutubeDL-Instanz für einen Aufruf aus.
+        overrides: einzelne Optionen nur für diesen Aufruf überschreiben (z.B. concurrent_fragment_downloads)
+        """
+        ydl, generation = self._acquire(profile, logger)
+        params = ydl.params
+        saved_logger = params.get("logger")
+        saved_outtmpl = params.get("outtmpl")
+        saved_overrides = {key: params.get(key) for key in overrides or {}}
+        ok = False
+        try:
+            ydl._progress_hooks = list(progress_hooks)
+            params.update(overrides or {})
+            if logger is not None:
+                params["logger"] = logger
+            if outtmpl is not None:
+                params["outtmpl"] = {"default": outtmpl}
+                ydl._parse_outtmpl()
+            ydl._download_retcode = 0
+            yield ydl
+            ok = True
+        finally:
+            ydl._progress_hooks = []
+            params["logger"] = saved_logger
+            params["outtmpl"] = saved_outtmpl
+            params.update(saved_overrides)
+            # nach Fehlern nicht wiederverwenden, der interne Zustand ist unklar
+            if ok:
+                self._release(profile, generation, ydl)
+            else:
+                self._close_quietly(ydl)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = [ydl for pool in self._idle.values() for ydl in pool]
+            self._idle.clear()
+        for ydl in idle:
+            self._close_quietly(ydl)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "profiles": sorted(self._profiles),
+                "idle": {name: len(pool) for name, pool in self._idle.items()},
+                "created": self.created,
+                "reused": self.reused,
+            }
+
+    # Hilfsfunktionen
+    def _acquire(self, profile: str, logger: Optional[object] = None) -> tuple[yt_dlp.YoutubeDL, int]:
+        with self._lock:
+            if profile not in self._profiles:
+                raise KeyError(f"Unbekanntes yt-dlp Profil: {profile}")
+            generation = self._generation[profile]
+            pool = self._idle.get(profile)
+            if pool:
+                self.reused += 1
+                return pool.pop(), generation
+            opts = dict(self._profiles[profile])
+            if self.request_hooks:
+                opts["request_hooks"] = list(self.request_hooks)
+            self.created += 1
+        if logger is not None:
+            # Debug-Header etc. beim Bauen landen im Logger des ersten Aufrufers
+            opts["logger"] = logger
+        # Konstruktion außerhalb des Locks, sie ist teuer (Cookies, Request-Handler, ...)
+        return yt_dlp.YoutubeDL(opts), generation
+
+    def _release(self, profile: str, generation: int, ydl: yt_dlp.YoutubeDL) -> None:
+        with self._lock:
+            pool = self._idle.setdefault(profile, [])
+            if (
+                not self._closed
+                and self._generation.get(profile) == generation
+                and len(pool) < self.max_idle_per_profile
+            ):
+                pool.append(ydl)
+                return
+        self._close_quietly(ydl)
+
+    @staticmethod
+    def _close_quietly(ydl: yt_dlp.YoutubeDL) -> None:
+        try:
+            ydl.close()
+        except Exception:
+            pass
@@ -29,6 +29,8 @@ from .compat import urllib  # isort: split
 from .compat import urllib_req_to_req
 from .cookies import CookieLoadError, LenientSimpleCookie, load_cookies
 from .downloader import FFmpegFD, get_suitable_downloader, shorten_protocol_name
+from .downloader.fragment import FragmentFD
+from .downloader.http import HttpFD
 from .downloader.rtmp import rtmpdump_version
 from .extractor import gen_extractor_classes, get_info_extractor, import_extractors
 from .extractor.common import UnsupportedURLIE
@@ -114,6 +116,7 @@ from .utils import (
     YoutubeDLError,
     age_restricted,
     bug_reports_message,
+    cached_exe_probe,
     date_from_str,
     deprecation_warning,
     determine_ext,
@@ -422,6 +425,12 @@ class YoutubeDL:
 
                        Progress hooks are guaranteed to be called at least twice
                        (with status "started" and "finished") if the processing is successful.
+    request_hooks:     A list of functions that get called after each request sent
+                       through urlopen, with a dictionary with the entries
+                       * url: The requested URL
+                       * status: The HTTP status code of the response
+                       * elapsed: Seconds until the response (headers) arrived
+                       Requests that fail without an HTTP response are not reported.
     merge_output_format: "/" separated list of extensions to use when merging formats.
     final_ext:         Expected final extension; used to detect when the file was
                        already downloaded and converted
@@ -512,7 +521,8 @@ class YoutubeDL:
     nopart, updatetime, buffersize, ratelimit, throttledratelimit, min_filesize,
     max_filesize, test, noresizebuffer, retries, file_access_retries, fragment_retries,
     continuedl, xattr_set_filesize, hls_use_mpegts, http_chunk_size,
-    external_downloader_args, concurrent_fragment_downloads, progress_delta.
+    external_downloader_args, concurrent_fragment_downloads, progress_delta,
+    fragments_in_memory, fragment_memory_limit, ytdl_file_interval, ytdl_file_fragments.
 
     The following options are used by the post processors:
     ffmpeg_location:   Location of the ffmpeg/avconv binary; either the path
@@ -616,7 +626,7 @@ class YoutubeDL:
         'preference', 'language', 'language_preference', 'quality', 'source_preference', 'cookies',
         'http_headers', 'stretched_ratio', 'no_resume', 'has_drm', 'extra_param_to_segment_url', 'extra_param_to_key_url',
         'hls_aes', 'downloader_options', 'impersonate', 'page_url', 'app', 'play_path', 'tc_url', 'flash_version',
-        'rtmp_live', 'rtmp_conn', 'rtmp_protocol', 'rtmp_real_time',
+        'rtmp_live', 'rtmp_conn', 'rtmp_protocol', 'rtmp_real_time', 'url_resolver',
     }
     _deprecated_multivalue_fields = {
         'album_artist': 'album_artists',
@@ -648,6 +658,7 @@ class YoutubeDL:
         self._close_hooks = []
         self._progress_hooks = []
         self._postprocessor_hooks = []
+        self._request_hooks = []
         self._download_retcode = 0
         self._num_downloads = 0
         self._num_videos = 0
@@ -820,6 +831,7 @@ class YoutubeDL:
             'post_hooks': self.add_post_hook,
             'progress_hooks': self.add_progress_hook,
             'postprocessor_hooks': self.add_postprocessor_hook,
+            'request_hooks': self.add_request_hook,
         }
         for opt, fn in hooks.items():
             for ph in self.params.get(opt, []):
@@ -924,6 +936,10 @@ class YoutubeDL:
         """Add the download progress hook"""
         self._progress_hooks.append(ph)
 
+    def add_request_hook(self, rh):
+        """Add the request hook"""
+        self._request_hooks.append(rh)
+
     def add_postprocessor_hook(self, ph):
         """Add the postprocessing progress hook"""
         self._postprocessor_hooks.append(ph)
@@ -3030,6 +3046,8 @@ class YoutubeDL:
             self.report_warning('Requested format is not available')
             # Process what we can, even without any available formats.
             formats_to_download = [{}]
+        else:
+            self._resolve_format_urls(info_dict, formats_to_download)
 
         requested_ranges = tuple(self.params.get('download_ranges', lambda *_: [{}])(info_dict, self))
         best_format, downloaded_formats = formats_to_download[-1], []
@@ -3087,6 +3105,19 @@ class YoutubeDL:
         info_dict.update(best_format)
         return info_dict
 
+    def _resolve_format_urls(self, info_dict, formats):
+        """Fetch the final URL of selected formats that were extracted with a "url_resolver" """
+        for fmt in formats:
+            for f in fmt.get('requested_formats') or [fmt]:
+                ie_key = f.get('url_resolver')
+                if not ie_key:
+                    continue
+                ie = self.get_info_extractor(ie_key)
+                ie.initialize()
+                f['url'] = sanitize_url(ie._resolve_format_url(f, info_dict))
+                del f['url_resolver']
+                f['http_headers'] = self._calc_headers(collections.ChainMap(f, info_dict), load_cookies=True)
+
     def process_subtitles(self, video_id, normal_subtitles, automatic_captions):
         """Select the requested subtitles and their format"""
         available_subs, normal_sub_langs = {}, []
@@ -3216,7 +3247,12 @@ class YoutubeDL:
         if self.params.get('forcejson'):
             self.to_stdout(json.dumps(self.sanitize_info(info_dict)))
 
-    def dl(self, name, info, subtitle=False, test=False):
+    def dl(self, name, info, subtitle=False, test=False, pipe=None):
+        """
+        Download a single format to name
+        @param pipe  Binary file-like object to write the data to instead of a file, eg. the
+                     stdin of a converter. Only the native http and fragment downloaders support it
+        """
         if not info.get('url'):
             self.raise_no_formats(info, True)
 
@@ -3237,7 +3273,12 @@ class YoutubeDL:
         else:
             params = self.params
 
-        fd = get_suitable_downloader(info, params, to_stdout=(name == '-'))(self, params)
+        fd = get_suitable_downloader(info, params, to_stdout=(name == '-' and pipe is None))(self, params)
+        if pipe is not None:
+            if not isinstance(fd, (HttpFD, FragmentFD)):
+                raise DownloadError(f'The {fd.FD_NAME} downloader can not write to a pipe')
+            fd.output_pipe = pipe
+            name = '-'
         if not test:
             for ph in self._progress_hooks:
                 fd.add_progress_hook(ph)
@@ -4099,8 +4140,8 @@ class YoutubeDL:
         if ffmpeg_features:
             exe_versions['ffmpeg'] += ' ({})'.format(','.join(sorted(ffmpeg_features)))
 
-        exe_versions['rtmpdump'] = rtmpdump_version()
-        exe_versions['phantomjs'] = PhantomJSwrapper._version()
+        exe_versions['rtmpdump'] = cached_exe_probe('rtmpdump', 'rtmpdump', rtmpdump_version, self.cache)
+        exe_versions['phantomjs'] = cached_exe_probe('phantomjs', 'phantomjs', PhantomJSwrapper._version, self.cache)
         exe_str = ', '.join(
             f'{exe} {v}' for exe, v in sorted(exe_versions.items()) if v
         ) or 'none'
@@ -4215,6 +4256,17 @@ class YoutubeDL:
             f'  https://github.com/yt-dlp/yt-dlp#impersonation  '
             f'for information on installing the required dependencies')
 
+    def _report_request(self, req, status, start):
+        if not self._request_hooks:
+            return
+        info = {'url': req.url, 'status': status, 'elapsed': time.monotonic() - start}
+        for rh in self._request_hooks:
+            # the request itself has been sent already; a failing hook must not fail it
+            try:
+                rh(info)
+            except Exception as err:
+                self.report_warning(f'request hook: {err}')
+
     def urlopen(self, req):
         """ Start an HTTP download """
         if isinstance(req, str):
@@ -4235,8 +4287,14 @@ class YoutubeDL:
         clean_proxies(proxies=req.proxies, headers=req.headers)
         clean_headers(req.headers)
 
+        start = time.monotonic()
         try:
-            return self._request_director.send(req)
+            res = self._request_director.send(req)
+            self._report_request(req, res.status, start)
+            return res
+        except HTTPError as e:
+            self._report_request(req, e.status, start)
+            raise
         except NoSupportingHandlers as e:
             for ue in e.unsupported_errors:
                 # FIXME: This depends on the order of errors.
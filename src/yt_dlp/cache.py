@@ -14,12 +14,16 @@ class Cache:
     def __init__(self, ydl):
         self._ydl = ydl
 
-    def _get_root_dir(self):
-        res = self._ydl.params.get('cachedir')
-        if res is None:
+    @staticmethod
+    def root_dir(cachedir=None):
+        """Cache root for the given "cachedir" param, for caches that live next to the JSON sections"""
+        if cachedir is None:
             cache_root = os.getenv('XDG_CACHE_HOME', '~/.cache')
-            res = os.path.join(cache_root, 'yt-dlp')
-        return expand_path(res)
+            cachedir = os.path.join(cache_root, 'yt-dlp')
+        return expand_path(cachedir)
+
+    def _get_root_dir(self):
+        return self.root_dir(self._ydl.params.get('cachedir'))
 
     def _get_cache_fn(self, section, key, dtype):
         assert re.match(r'^[\w.-]+$', section), f'invalid section {section!r}'
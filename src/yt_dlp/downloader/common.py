@@ -81,6 +81,8 @@ class FileDownloader:
 
     _TEST_FILE_SIZE = 10241
     params = None
+    # Binary file-like object that receives the data instead of stdout when downloading to "-"
+    output_pipe = None
 
     def __init__(self, ydl, params):
         """Create a FileDownloader object with the given options."""
@@ -252,6 +254,8 @@ class FileDownloader:
 
     @wrap_file_access('open', fatal=True)
     def sanitize_open(self, filename, open_mode):
+        if filename == '-' and self.output_pipe is not None:
+            return self.output_pipe, filename
         f, filename = sanitize_open(filename, open_mode)
         if not getattr(f, 'locked', None):
             self.write_debug(f'{LockingUnsupportedError.msg}. Proceeding without locking', only_once=True)
@@ -1,9 +1,11 @@
 import concurrent.futures
 import contextlib
+import io
 import json
 import math
 import os
 import struct
+import threading
 import time
 
 from .common import FileDownloader
@@ -23,6 +25,82 @@ class HttpQuietDownloader(HttpFD):
     to_console_title = to_screen
 
 
+class _FragmentMemoryStore:
+    """
+    Bounded in-memory store for downloaded fragments, keyed by fragment filename.
+
+    Fragments that would exceed the memory limit are spilled to their usual
+    fragment file on disk instead.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.size = 0
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def put(self, name, data):
+        with self._lock:
+            self.size -= len(self._data.pop(name, b''))
+            if self.size + len(data) <= self.limit:
+                self._data[name] = data
+                self.size += len(data)
+                return
+        with open(name, 'wb') as f:
+            f.write(data)
+
+    def pop(self, name):
+        with self._lock:
+            data = self._data.pop(name, None)
+            if data is not None:
+                self.size -= len(data)
+            return data
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+
+class _FragmentBuffer(io.BytesIO):
+    """BytesIO that hands its content to the store when closed"""
+
+    def __init__(self, store, name, initial_bytes=b''):
+        super().__init__(initial_bytes)
+        self.seek(0, io.SEEK_END)
+        self._store = store
+        self.name = name
+
+    def close(self):
+        if not self.closed:
+            self._store.put(self.name, self.getvalue())
+        super().close()
+
+
+class HttpMemoryDownloader(HttpQuietDownloader):
+    """Fragment downloader that writes into a _FragmentMemoryStore instead of files"""
+
+    def __init__(self, ydl, params, store):
+        super().__init__(ydl, params)
+        self._store = store
+
+    def temp_name(self, filename):
+        return filename
+
+    def sanitize_open(self, filename, open_mode):
+        data = self._store.pop(filename)
+        if open_mode == 'ab':
+            if data is None and os.path.isfile(filename):
+                # Spilled to disk earlier, keep appending there
+                return super().sanitize_open(filename, open_mode)
+            return _FragmentBuffer(self._store, filename, data or b''), filename
+        self.try_remove(filename)
+        return _FragmentBuffer(self._store, filename), filename
+
+    def try_rename(self, old_filename, new_filename):
+        pass
+
+
 class FragmentFD(FileDownloader):
     """
     A base file downloader class for fragmented media (e.g. f4m/m3u8 manifests).
@@ -36,6 +114,14 @@ class FragmentFD(FileDownloader):
     keep_fragments:     Keep downloaded fragments on disk after downloading is
                         finished
     concurrent_fragment_downloads:  The number of threads to use for native hls and dash downloads
+    fragments_in_memory: Keep downloaded fragments in memory until they are appended
+                        instead of writing them to temporary files (ignored with keep_fragments)
+    fragment_memory_limit: Maximum number of bytes of fragments held in memory before
+                        further fragments are spilled to disk. Default is 32 MiB
+    ytdl_file_interval: Minimum number of seconds between .ytdl resume-state writes.
+                        Default is 0 (write after every fragment)
+    ytdl_file_fragments: Write the .ytdl file at least every this many fragments,
+                        even if ytdl_file_interval has not elapsed yet
     _no_ytdl_file:      Don't use .ytdl file
 
     For each incomplete fragment download yt-dlp keeps on disk a special
@@ -55,6 +141,9 @@ class FragmentFD(FileDownloader):
                 index:  0-based index of current fragment among all fragments
             fragment_count:
                 Total count of fragments
+            dest_size:
+                Size in bytes of the partial output file that matches current_fragment.
+                On resume, any data beyond it is truncated
 
     This feature is experimental and file format may change in future.
     """
@@ -85,6 +174,8 @@ class FragmentFD(FileDownloader):
         try:
             ytdl_data = json.loads(stream.read())
             ctx['fragment_index'] = ytdl_data['downloader']['current_fragment']['index']
+            if 'dest_size' in ytdl_data['downloader']:
+                ctx['ytdl_dest_size'] = ytdl_data['downloader']['dest_size']
             if 'extra_state' in ytdl_data['downloader']:
                 ctx['extra_state'] = ytdl_data['downloader']['extra_state']
         except Exception:
@@ -97,9 +188,11 @@ class FragmentFD(FileDownloader):
         try:
             downloader = {
                 'current_fragment': {
-                    'index': ctx['fragment_index'],
+                    'index': ctx.get('appended_fragment_index', ctx['fragment_index']),
                 },
             }
+            if ctx.get('dest_size') is not None:
+                downloader['dest_size'] = ctx['dest_size']
             if 'extra_state' in ctx:
                 downloader['extra_state'] = ctx['extra_state']
             if ctx.get('fragment_count') is not None:
@@ -121,17 +214,30 @@ class FragmentFD(FileDownloader):
             frag_resume_len = self.filesize_or_none(self.temp_name(fragment_filename))
         fragment_info_dict['frag_resume_len'] = ctx['frag_resume_len'] = frag_resume_len
 
-        success, _ = ctx['dl'].download(fragment_filename, fragment_info_dict)
+        try:
+            success, _ = ctx['dl'].download(fragment_filename, fragment_info_dict)
+        except BaseException:
+            self._discard_fragment(ctx, fragment_filename)
+            raise
         if not success:
+            self._discard_fragment(ctx, fragment_filename)
             return False
         if fragment_info_dict.get('filetime'):
             ctx['fragment_filetime'] = fragment_info_dict.get('filetime')
         ctx['fragment_filename_sanitized'] = fragment_filename
         return True
 
+    def _discard_fragment(self, ctx, fragment_filename):
+        if ctx.get('fragment_store') is not None:
+            ctx['fragment_store'].pop(fragment_filename)
+
     def _read_fragment(self, ctx):
         if not ctx.get('fragment_filename_sanitized'):
             return None
+        if ctx.get('fragment_store') is not None:
+            frag_content = ctx['fragment_store'].pop(ctx['fragment_filename_sanitized'])
+            if frag_content is not None:
+                return frag_content
         try:
             down, frag_sanitized = self.sanitize_open(ctx['fragment_filename_sanitized'], 'rb')
         except FileNotFoundError:
@@ -143,13 +249,33 @@ class FragmentFD(FileDownloader):
         down.close()
         return frag_content
 
+    def _checkpoint_ytdl_file(self, ctx, force=False):
+        """Write the .ytdl file if the configured time or fragment interval has been reached"""
+        if not self.__do_ytdl_file(ctx) or not ctx.get('ytdl_pending_frags'):
+            return
+        interval = self.params.get('ytdl_file_interval') or 0
+        max_frags = self.params.get('ytdl_file_fragments')
+        if not force and time.monotonic() - ctx.get('ytdl_written_at', 0) < interval:
+            if not max_frags or ctx['ytdl_pending_frags'] < max_frags:
+                return
+        # The data described by the checkpoint has to be on disk before the checkpoint itself.
+        # Its size is taken from the file, since some downloaders write headers directly
+        if not ctx['dest_stream'].closed:
+            ctx['dest_stream'].flush()
+            ctx['dest_size'] = ctx['dest_stream'].tell()
+        else:
+            ctx['dest_size'] = self.filesize_or_none(ctx['tmpfilename'])
+        self._write_ytdl_file(ctx)
+        ctx['ytdl_pending_frags'] = 0
+        ctx['ytdl_written_at'] = time.monotonic()
+
     def _append_fragment(self, ctx, frag_content):
         try:
             ctx['dest_stream'].write(frag_content)
-            ctx['dest_stream'].flush()
         finally:
-            if self.__do_ytdl_file(ctx):
-                self._write_ytdl_file(ctx)
+            ctx['appended_fragment_index'] = ctx['fragment_index']
+            ctx['ytdl_pending_frags'] = ctx.get('ytdl_pending_frags', 0) + 1
+            self._checkpoint_ytdl_file(ctx)
             if not self.params.get('keep_fragments', False):
                 self.try_remove(ctx['fragment_filename_sanitized'])
             del ctx['fragment_filename_sanitized']
@@ -164,14 +290,19 @@ class FragmentFD(FileDownloader):
             total_frags_str = 'unknown (live)'
         self.to_screen(f'[{self.FD_NAME}] Total fragments: {total_frags_str}')
         self.report_destination(ctx['filename'])
-        dl = HttpQuietDownloader(self.ydl, {
+        dl_params = {
             **self.params,
             'noprogress': True,
             'test': False,
             'sleep_interval': 0,
             'max_sleep_interval': 0,
             'sleep_interval_subtitles': 0,
-        })
+        }
+        if self.params.get('fragments_in_memory') and not self.params.get('keep_fragments', False):
+            ctx['fragment_store'] = _FragmentMemoryStore(self.params.get('fragment_memory_limit') or 32 * 1024 * 1024)
+            dl = HttpMemoryDownloader(self.ydl, dl_params, ctx['fragment_store'])
+        else:
+            dl = HttpQuietDownloader(self.ydl, dl_params)
         tmpfilename = self.temp_name(ctx['filename'])
         open_mode = 'wb'
 
@@ -203,6 +334,10 @@ class FragmentFD(FileDownloader):
                     if 'ytdl_corrupt' in ctx:
                         del ctx['ytdl_corrupt']
                     self._write_ytdl_file(ctx)
+                elif resume_len > ctx.get('ytdl_dest_size', resume_len):
+                    # Fragments appended after the last checkpoint are downloaded again
+                    resume_len = ctx['ytdl_dest_size']
+                    os.truncate(tmpfilename, resume_len)
 
             else:
                 if not continuedl:
@@ -217,6 +352,7 @@ class FragmentFD(FileDownloader):
         ctx.update({
             'dl': dl,
             'dest_stream': dest_stream,
+            'dest_size': resume_len,
             'tmpfilename': tmpfilename,
             # Total complete fragments downloaded so far in bytes
             'complete_frags_downloaded_bytes': resume_len,
@@ -284,6 +420,9 @@ class FragmentFD(FileDownloader):
 
     def _finish_frag_download(self, ctx, info_dict):
         ctx['dest_stream'].close()
+        ctx['ytdl_pending_frags'] = 0
+        if ctx.get('fragment_store') is not None:
+            ctx['fragment_store'].clear()
         if self.__do_ytdl_file(ctx):
             self.try_remove(self.ytdl_filename(ctx['filename']))
         elapsed = time.time() - ctx['started']
@@ -428,7 +567,14 @@ class FragmentFD(FileDownloader):
         # so returning a intermediate result here instead of KeyboardInterrupt on live
         return result
 
-    def download_and_append_fragments(
+    def download_and_append_fragments(self, ctx, fragments, info_dict, **kwargs):
+        try:
+            return self._download_and_append_fragments(ctx, fragments, info_dict, **kwargs)
+        finally:
+            # Persist resume state held back by ytdl_file_interval on error or interrupt
+            self._checkpoint_ytdl_file(ctx, force=True)
+
+    def _download_and_append_fragments(
             self, ctx, fragments, info_dict, *, is_fatal=(lambda idx: False),
             pack_func=(lambda content, idx: content), finish_func=None,
             tpe=None, interrupt_trigger=(True, )):
@@ -121,6 +121,9 @@ class HlsFD(FragmentFD):
                         'add --check-formats to automatically fallback to the next best format', tb=False)
                 return False
             message = message or 'Unsupported features have been detected'
+            if self.output_pipe is not None:
+                self.report_error(f'{message}; the stream can not be written to a pipe', tb=False)
+                return False
             fd = FFmpegFD(self.ydl, self.params)
             self.report_warning(f'{message}; extraction will be delegated to {fd.get_basename()}')
             return fd.real_download(filename, info_dict)
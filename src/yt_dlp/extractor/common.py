@@ -264,6 +264,10 @@ class InfoExtractor:
                                 * a list or a tuple of CLIENT[:OS] strings or ImpersonateTarget instances
                                 * a boolean value; True means any impersonate target is sufficient
                     * available_at  Unix timestamp of when a format will be available to download
+                    * url_resolver  ie_key of the extractor that turns `url` into the final
+                                 media URL on demand (see _resolve_format_url). Used when
+                                 getting the real URL is costly (e.g. one API call per
+                                 format); only the selected formats are resolved
                     * downloader_options  A dictionary of downloader options
                                  (For internal use only)
                                  * http_chunk_size Chunk size for HTTP downloads
@@ -3882,6 +3886,10 @@ class InfoExtractor:
     def _get_subtitles(self, *args, **kwargs):
         raise NotImplementedError('This method must be implemented by subclasses')
 
+    def _resolve_format_url(self, fmt, info_dict):
+        """Returns the final media URL of a format that has "url_resolver" set"""
+        raise NotImplementedError('This method must be implemented by subclasses')
+
     class CommentsDisabled(Exception):
         """Raise in _get_comments if comments are disabled for the video"""
 
@@ -1,7 +1,10 @@
+import concurrent.futures
 import functools
 import itertools
 import json
 import re
+import threading
+import time
 
 from .common import InfoExtractor, SearchInfoExtractor
 from ..networking import HEADRequest
@@ -23,6 +26,30 @@ from ..utils import (
 from ..utils.traversal import traverse_obj
 
 
+class _TokenBucket:
+    """Thread-safe token bucket: `capacity` requests per `window` seconds, with bursts up to `capacity`"""
+
+    def __init__(self, capacity, window):
+        self.capacity = capacity
+        self._rate = capacity / window
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available. Returns the number of seconds waited"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Reserve the token right away so that waiting callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
 class SoundcloudEmbedIE(InfoExtractor):
     _VALID_URL = r'https?://(?:w|player|p)\.soundcloud\.com/player/?.*?\burl=(?P<id>.+)'
     _EMBED_REGEX = [r'<iframe[^>]+src=(["\'])(?P<url>(?:https?://)?(?:w\.)?soundcloud\.com/player.+?)\1']
@@ -106,6 +133,16 @@ class SoundcloudBaseIE(InfoExtractor):
 
     _DEFAULT_FORMATS = ['http_aac', 'hls_aac', 'http_opus', 'hls_opus', 'http_mp3', 'hls_mp3']
 
+    # Shared by all instances (and thus all YoutubeDL objects) of the process:
+    # the API request budget and the client_id, which is refreshed by only one thread at a time
+    _API_BUDGET = _TokenBucket(600, 600)
+    _CLIENT_ID_LOCK = threading.Lock()
+    _shared_client_id = None
+    _SCRIPT_WORKERS = 4
+
+    # Bitrates of the presets without a "<abr>k" suffix (as seen in their stream URLs)
+    _PRESET_ABR = {'mp3': 128, 'opus': 64}
+
     @functools.cached_property
     def _is_requested(self):
         return re.compile(r'|'.join(set(
@@ -119,32 +156,54 @@ class SoundcloudBaseIE(InfoExtractor):
 
     def _update_client_id(self):
         webpage = self._download_webpage('https://soundcloud.com/', None)
-        for src in reversed(re.findall(r'<script[^>]+src="([^"]+)"', webpage)):
+        scripts = list(reversed(re.findall(r'<script[^>]+src="([^"]+)"', webpage)))
+
+        def find_client_id(src):
             script = self._download_webpage(src, None, fatal=False)
-            if script:
-                client_id = self._search_regex(
-                    r'client_id\s*:\s*"([0-9a-zA-Z]{32})"',
-                    script, 'client id', default=None)
+            return script and self._search_regex(
+                r'client_id\s*:\s*"([0-9a-zA-Z]{32})"', script, 'client id', default=None)
+
+        # Fetch the scripts concurrently, but still prefer the id from the last script
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._SCRIPT_WORKERS)
+        try:
+            for future in [pool.submit(find_client_id, src) for src in scripts]:
+                client_id = future.result()
                 if client_id:
                     self._CLIENT_ID = client_id
                     self._store_client_id(client_id)
                     return
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         raise ExtractorError('Unable to extract client id')
 
+    def _refresh_client_id(self, stale_client_id):
+        with SoundcloudBaseIE._CLIENT_ID_LOCK:
+            shared = SoundcloudBaseIE._shared_client_id
+            if shared and shared != stale_client_id:
+                # Another thread already refreshed it while we were waiting for the lock
+                self._CLIENT_ID = shared
+                return
+            self._store_client_id(None)
+            self._update_client_id()
+            SoundcloudBaseIE._shared_client_id = self._CLIENT_ID
+
     def _call_api(self, *args, **kwargs):
         non_fatal = kwargs.get('fatal') is False
         if non_fatal:
             del kwargs['fatal']
         query = kwargs.get('query', {}).copy()
         for _ in range(2):
-            query['client_id'] = self._CLIENT_ID
+            self._CLIENT_ID = SoundcloudBaseIE._shared_client_id or self._CLIENT_ID
+            query['client_id'] = client_id = self._CLIENT_ID
             kwargs['query'] = query
+            waited = self._API_BUDGET.acquire()
+            if waited:
+                self.write_debug(f'API request budget exhausted; waited {waited:.1f}s')
             try:
                 return self._download_json(*args, **kwargs)
             except ExtractorError as e:
                 if isinstance(e.cause, HTTPError) and e.cause.status in (401, 403):
-                    self._store_client_id(None)
-                    self._update_client_id()
+                    self._refresh_client_id(client_id)
                     continue
                 elif non_fatal:
                     self.report_warning(str(e))
@@ -152,7 +211,9 @@ class SoundcloudBaseIE(InfoExtractor):
                 raise
 
     def _initialize_pre_login(self):
-        self._CLIENT_ID = self.cache.load('soundcloud', 'client_id') or 'a3e059563d7fd3372b49b37f00a00bcf'
+        self._CLIENT_ID = (
+            SoundcloudBaseIE._shared_client_id
+            or self.cache.load('soundcloud', 'client_id') or 'a3e059563d7fd3372b49b37f00a00bcf')
 
     def _verify_oauth_token(self, token):
         if self._request_webpage(
@@ -316,13 +377,11 @@ class SoundcloudBaseIE(InfoExtractor):
                 self.write_debug(f'"{short_identifier}" is not a requested format, skipping')
                 continue
 
-            # XXX: if not extract_flat, 429 error must be caught where _extract_info_dict is called
-            stream_url = traverse_obj(self._call_api(
-                format_url, track_id, f'Downloading {short_identifier} format info JSON',
-                query=query, headers=self._HEADERS), ('url', {url_or_none}))
-            if invalid_url(stream_url):
+            # The signed stream URL is only fetched for the formats that get selected, see _resolve_format_url
+            transcoding_url = update_url_query(format_url, {'secret_token': secret_token}) if secret_token else format_url
+            if invalid_url(transcoding_url):
                 continue
-            format_urls.add(stream_url)
+            format_urls.add(transcoding_url)
 
             mime_type = traverse_obj(t, ('format', 'mime_type', {str}))
             codec = self._search_regex(r'codecs="([^"]+)"', mime_type, 'codec', default=None)
@@ -336,16 +395,15 @@ class SoundcloudBaseIE(InfoExtractor):
             is_premium = t.get('quality') == 'hq'
             abr = int_or_none(
                 self._search_regex(r'(\d+)k$', preset, 'abr', default=None)
-                or self._search_regex(r'\.(\d+)\.(?:opus|mp3)[/?]', stream_url, 'abr', default=None)
-                or (256 if (is_premium and 'aac' in preset) else None))
+                or (256 if (is_premium and 'aac' in preset) else None)
+                or self._PRESET_ABR.get(preset_base))
 
-            is_preview = (t.get('snipped')
-                          or '/preview/' in format_url
-                          or re.search(r'/(?:preview|playlist)/0/30/', stream_url))
+            is_preview = t.get('snipped') or '/preview/' in format_url
 
             formats.append({
                 'format_id': join_nonempty(protocol, preset, is_preview and 'preview', delim='_'),
-                'url': stream_url,
+                'url': transcoding_url,
+                'url_resolver': self.ie_key(),
                 'ext': ext,
                 'acodec': codec,
                 'vcodec': 'none',
@@ -416,6 +474,15 @@ class SoundcloudBaseIE(InfoExtractor):
             'formats': formats if not extract_flat else None,
         }
 
+    def _resolve_format_url(self, fmt, info_dict):
+        # XXX: 429 error must be caught where the format is resolved
+        stream_url = traverse_obj(self._call_api(
+            fmt['url'], info_dict['id'], f'Downloading {fmt["format_id"]} format info JSON',
+            headers=self._HEADERS), ('url', {url_or_none}))
+        if not stream_url:
+            raise ExtractorError(f'Unable to get the stream URL of format {fmt["format_id"]}')
+        return stream_url
+
     @classmethod
     def _resolv_url(cls, url):
         return cls._API_V2_BASE + 'resolve?url=' + url
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import collections
 import functools
 import http.client
 import io
 import ssl
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -62,6 +65,83 @@ def _create_http_connection(http_class, source_address, *args, **kwargs):
     return hc
 
 
+class _HTTPConnectionPool:
+    """Bounded per-host store of idle keep-alive connections
+
+    Connections are only ever handed to one request at a time; a connection is
+    put back once its response body has been fully consumed.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=30.0):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle = collections.defaultdict(collections.deque)
+        self._closed = False
+
+    def _pop_expired(self, idle, now):
+        expired = []
+        while idle and now - idle[0][1] > self.idle_timeout:
+            expired.append(idle.popleft()[0])
+        return expired
+
+    def get(self, key):
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key)
+            expired = self._pop_expired(idle, time.monotonic()) if idle else []
+            while idle and conn is None:
+                candidate = idle.pop()[0]
+                if candidate.sock is None:
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+        for stale in expired:
+            stale.close()
+        return conn
+
+    def put(self, key, conn):
+        expired = []
+        with self._lock:
+            if not self._closed and conn.sock is not None:
+                idle = self._idle[key]
+                expired = self._pop_expired(idle, time.monotonic())
+                if len(idle) < self.maxsize:
+                    idle.append((conn, time.monotonic()))
+                    conn = None
+        for stale in filter(None, (*expired, conn)):
+            stale.close()
+
+    def release_on_complete(self, key, conn, response):
+        """Return conn to the pool once response has been read to the end"""
+        close, close_conn = response.close, response._close_conn
+        closed_early = False
+
+        def _close():
+            nonlocal closed_early
+            # fp is only still set if the body has not been consumed
+            closed_early = response.fp is not None
+            close()
+
+        def _close_conn():
+            close_conn()
+            if closed_early:
+                conn.close()
+            else:
+                self.put(key, conn)
+
+        response.close = _close
+        response._close_conn = _close_conn
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            conns = [conn for idle in self._idle.values() for conn, _ in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+
 class HTTPHandler(urllib.request.AbstractHTTPHandler):
     """Handler for HTTP requests and responses.
 
@@ -77,10 +157,11 @@ class HTTPHandler(urllib.request.AbstractHTTPHandler):
     public domain.
     """
 
-    def __init__(self, context=None, source_address=None, *args, **kwargs):
+    def __init__(self, context=None, source_address=None, connection_pool=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._source_address = source_address
         self._context = context
+        self._connection_pool = connection_pool
 
     @staticmethod
     def _make_conn_class(base, req):
@@ -92,15 +173,74 @@ class HTTPHandler(urllib.request.AbstractHTTPHandler):
 
     def http_open(self, req):
         conn_class = self._make_conn_class(http.client.HTTPConnection, req)
-        return self.do_open(functools.partial(
-            _create_http_connection, conn_class, self._source_address), req)
+        return self._do_open(conn_class, req)
 
     def https_open(self, req):
         conn_class = self._make_conn_class(http.client.HTTPSConnection, req)
-        return self.do_open(
-            functools.partial(
-                _create_http_connection, conn_class, self._source_address),
-            req, context=self._context)
+        return self._do_open(conn_class, req, context=self._context)
+
+    def _do_open(self, conn_class, req, **http_conn_args):
+        http_class = functools.partial(_create_http_connection, conn_class, self._source_address)
+        # Socks and CONNECT-tunnelled connections are not pooled
+        if (self._connection_pool is None or req._tunnel_host
+                or conn_class not in (http.client.HTTPConnection, http.client.HTTPSConnection)):
+            return self.do_open(http_class, req, **http_conn_args)
+        return self._do_pooled_open(http_class, req, **http_conn_args)
+
+    def _do_pooled_open(self, http_class, req, **http_conn_args):
+        """Keep-alive variant of AbstractHTTPHandler.do_open"""
+        host = req.host
+        if not host:
+            raise urllib.error.URLError('no host given')
+
+        key = (req.type, host)
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers['Connection'] = 'keep-alive'
+        headers = {name.title(): val for name, val in headers.items()}
+        # A stale pooled connection is retried once, but only if the body can be sent again
+        can_retry = req.data is None or isinstance(req.data, (bytes, bytearray))
+
+        retried = False
+        while True:
+            h = None if retried else self._connection_pool.get(key)
+            reused = h is not None
+            if reused:
+                h.timeout = req.timeout
+                h.sock.settimeout(req.timeout)
+            else:
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                h.set_debuglevel(self._debuglevel)
+            try:
+                try:
+                    h.request(req.get_method(), req.selector, req.data, headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err:
+                    raise urllib.error.URLError(err)
+                r = h.getresponse()
+            except Exception as e:
+                h.close()
+                cause = getattr(e, 'reason', e)
+                if reused and can_retry and isinstance(cause, (ConnectionError, http.client.BadStatusLine)):
+                    retried = True
+                    continue
+                raise
+            break
+
+        if r.will_close:
+            if h.sock:
+                h.sock.close()
+                h.sock = None
+        else:
+            self._connection_pool.release_on_complete(key, h, r)
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+    def close(self):
+        if self._connection_pool is not None:
+            self._connection_pool.close()
 
     @staticmethod
     def deflate(data):
@@ -336,6 +476,8 @@ class UrllibRH(RequestHandler, InstanceStoreMixin):
     _SUPPORTED_PROXY_SCHEMES = ('http', 'socks4', 'socks4a', 'socks5', 'socks5h')
     _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
     RH_NAME = 'urllib'
+    _POOL_MAXSIZE = 10
+    _POOL_IDLE_TIMEOUT = 30.0
 
     def __init__(self, *, enable_file_urls: bool = False, **kwargs):
         super().__init__(**kwargs)
@@ -356,7 +498,8 @@ class UrllibRH(RequestHandler, InstanceStoreMixin):
             HTTPHandler(
                 debuglevel=int(bool(self.verbose)),
                 context=self._make_sslcontext(legacy_ssl_support=legacy_ssl_support),
-                source_address=self.source_address),
+                source_address=self.source_address,
+                connection_pool=_HTTPConnectionPool(self._POOL_MAXSIZE, self._POOL_IDLE_TIMEOUT)),
             HTTPCookieProcessor(cookiejar),
             DataHandler(),
             UnknownHandler(),
@@ -378,6 +521,13 @@ class UrllibRH(RequestHandler, InstanceStoreMixin):
         opener.addheaders = []
         return opener
 
+    def _close_instance(self, opener):
+        for handler in opener.handlers:
+            handler.close()
+
+    def close(self):
+        self._clear_instances()
+
     def _prepare_headers(self, _, headers):
         add_accept_encoding_header(headers, SUPPORTED_ENCODINGS)
 
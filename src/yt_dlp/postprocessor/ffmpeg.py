@@ -6,6 +6,7 @@ import json
 import os
 import re
 import subprocess
+import threading
 import time
 
 from .common import PostProcessor
@@ -16,6 +17,7 @@ from ..utils import (
     Popen,
     PostProcessingError,
     _get_exe_version_output,
+    cached_exe_probe,
     deprecation_warning,
     detect_exe_version,
     determine_ext,
@@ -59,6 +61,29 @@ ACODECS = {
     'wav': ('wav', None, ('-f', 'wav')),
 }
 
+# acodec of the format (RFC 6381 codecs string or short name) -> codec name reported by ffprobe
+_ACODEC_TO_AUDIO_CODEC = {
+    'mp4a': 'aac',
+    'aac': 'aac',
+    'mp3': 'mp3',
+    'opus': 'opus',
+    'vorbis': 'vorbis',
+    'flac': 'flac',
+    'alac': 'alac',
+    'ac-3': 'ac3',
+    'ec-3': 'eac3',
+}
+# Containers that can only hold one audio codec, for formats without acodec
+_EXT_TO_AUDIO_CODEC = {
+    'mp3': 'mp3',
+    'opus': 'opus',
+    'flac': 'flac',
+}
+
+# (realpath, size, mtime_ns) -> audio codec, see FFmpegPostProcessor.get_audio_codec
+_audio_codec_cache = {}
+_AUDIO_CODEC_CACHE_SIZE = 512
+
 
 def create_mapping_re(supported):
     return re.compile(r'{0}(?:/{0})*$'.format(r'(?:\s*\w+\s*>)?\s*(?:{})\s*'.format('|'.join(supported))))
@@ -138,6 +163,17 @@ class FFmpegPostProcessor(PostProcessor):
         path = self._paths.get(prog)
         if path in self._version_cache:
             return self._version_cache[path], self._features_cache.get(path, {})
+        cache = self._downloader.cache if self._downloader else None
+        ver, features = cached_exe_probe(
+            prog, path, functools.partial(self._probe_ffmpeg, prog, path), cache,
+            succeeded=lambda result: bool(result[0])) or (False, {})
+        self._version_cache[path] = ver
+        if features:
+            self._features_cache[path] = features
+        return ver, features
+
+    @staticmethod
+    def _probe_ffmpeg(prog, path):
         out = _get_exe_version_output(path, ['-bsfs'])
         ver = detect_exe_version(out) if out else False
         if ver:
@@ -150,18 +186,16 @@ class FFmpegPostProcessor(PostProcessor):
                 mobj = re.match(regex, ver)
                 if mobj:
                     ver = mobj.group(1)
-        self._version_cache[path] = ver
         if prog != 'ffmpeg' or not out:
             return ver, {}
 
         mobj = re.search(r'(?m)^\s+libavformat\s+(?:[0-9. ]+)\s+/\s+(?P<runtime>[0-9. ]+)', out)
         lavf_runtime_version = mobj.group('runtime').replace(' ', '') if mobj else None
-        self._features_cache[path] = features = {
+        return ver, {
             'fdk': '--enable-libfdk-aac' in out,
             'setts': 'setts' in out.splitlines(),
             'needs_adtstoasc': is_outdated_version(lavf_runtime_version, '57.56.100', False),
         }
-        return ver, features
 
     @property
     def _versions(self):
@@ -236,7 +270,46 @@ class FFmpegPostProcessor(PostProcessor):
             self.report_warning(f'Your copy of {self.basename} is outdated, update {self.basename} '
                                 f'to version {required_version} or newer if you encounter any errors')
 
-    def get_audio_codec(self, path):
+    @staticmethod
+    def _audio_codec_from_info(info):
+        """Codec name as ffprobe would report it, from the format metadata (None if unknown)"""
+        acodec = info.get('acodec')
+        if acodec == 'none':
+            return None
+        if not acodec:
+            return _EXT_TO_AUDIO_CODEC.get(info.get('ext'))
+        acodec = acodec.lower()
+        if acodec in ('mp4a.40.34', 'mp4a.6b', 'mp4a.69'):
+            return 'mp3'
+        return _ACODEC_TO_AUDIO_CODEC.get(acodec.split('.')[0])
+
+    def get_audio_codec(self, path, info=None):
+        """
+        Audio codec of the file at path.
+        If info (the info dict of the file) already has the codec, no process is spawned.
+        Probe results are cached per process, keyed by path, size and mtime of the file
+        """
+        if info:
+            codec = self._audio_codec_from_info(info)
+            if codec:
+                self.write_debug(f'Using audio codec {codec} from format metadata')
+                return codec
+        try:
+            st = os.stat(path)
+        except OSError:
+            key = None
+        else:
+            key = (os.path.realpath(path), st.st_size, st.st_mtime_ns)
+            if key in _audio_codec_cache:
+                return _audio_codec_cache[key]
+        codec = self._probe_audio_codec(path)
+        if key is not None and codec is not None:
+            _audio_codec_cache[key] = codec
+            while len(_audio_codec_cache) > _AUDIO_CODEC_CACHE_SIZE:
+                _audio_codec_cache.pop(next(iter(_audio_codec_cache)))
+        return codec
+
+    def _probe_audio_codec(self, path):
         if not self.probe_available and not self.available:
             raise PostProcessingError('ffprobe and ffmpeg not found. Please install or provide the path using --ffmpeg-location')
         try:
@@ -490,7 +563,7 @@ class FFmpegExtractAudioPP(FFmpegPostProcessor):
             self.to_screen(f'Not converting audio {orig_path}; {_skip_msg}')
             return [], information
 
-        filecodec = self.get_audio_codec(path)
+        filecodec = self.get_audio_codec(path, information)
         if filecodec is None:
             raise PostProcessingError('WARNING: unable to obtain file audio codec with ffprobe')
 
@@ -533,6 +606,9 @@ class FFmpegExtractAudioPP(FFmpegPostProcessor):
         os.replace(temp_path, new_path)
         information['filepath'] = new_path
         information['ext'] = extension
+        # Keep the metadata in sync with the file, later postprocessors trust it instead of probing
+        information['acodec'] = filecodec if acodec == 'copy' else _ACODEC_TO_AUDIO_CODEC.get(
+            'aac' if target_format == 'm4a' else target_format)
 
         # Try to update the date time for extracted audio file.
         if information.get('filetime') is not None:
@@ -541,6 +617,120 @@ class FFmpegExtractAudioPP(FFmpegPostProcessor):
 
         return [orig_path], information
 
+    # Containers that ffmpeg can decode from a non-seekable stream
+    STREAMABLE_EXTS = ('mp3', 'opus', 'ogg', 'oga', 'webm', 'aac', 'flac', 'wav', 'ts')
+
+    def pipe_writer(self, information):
+        """
+        Open an ffmpeg process that converts the audio while it is being downloaded.
+        The downloader writes into the returned FFmpegPipeWriter instead of a file (see YoutubeDL.dl).
+        Only the lossy conversion to a fixed codec is supported, since the file codec is
+        taken from the format metadata instead of ffprobe.
+
+        @returns (writer, new_path) or None if the conversion can not be done from a stream
+        """
+        path = information['filepath']
+        target_format, _ = resolve_mapping(information['ext'], self.mapping)
+        if not target_format or target_format == 'best':
+            return None
+        if information.get('protocol') not in ('m3u8_native', 'http_dash_segments') \
+                and information['ext'] not in self.STREAMABLE_EXTS:
+            # eg. a progressive m4a may have its moov atom at the end
+            return None
+        extension, acodec, more_opts = ACODECS[target_format]
+        new_path = replace_extension(path, extension, information['ext'])
+        if new_path == path:
+            return None
+
+        self.check_version()
+        if acodec == 'aac' and self._features.get('fdk'):
+            acodec, more_opts = 'libfdk_aac', []
+        if acodec is not None:
+            more_opts = self._quality_args(acodec)
+        self.to_screen(f'Destination: {new_path} (converting while downloading)')
+        acodec_opts = ['-acodec', acodec] if acodec else []
+        return FFmpegPipeWriter(self, new_path, ['-vn', *acodec_opts, *more_opts]), new_path
+
+
+class FFmpegPipeWriter:
+    """
+    Binary file-like object that feeds the written bytes to ffmpeg's stdin.
+    close() only ends the input (the fragment downloaders close their destination);
+    finish() waits for ffmpeg and raises PostProcessingError if it failed.
+    """
+
+    def __init__(self, pp, out_path, opts):
+        self._pp = pp
+        self.out_path = out_path
+        cmd = [
+            pp.executable, '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', 'pipe:0', *opts, pp._ffmpeg_filename_argument(prepend_extension(out_path, 'temp'))]
+        pp.write_debug(f'ffmpeg command line: {shell_quote(cmd)}')
+        self._proc = Popen(
+            [encodeArgument(arg) for arg in cmd], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE)
+        # Drain stderr so that ffmpeg can never block on a full pipe while we write to stdin
+        self._stderr = []
+        self._stderr_thread = threading.Thread(
+            target=lambda: self._stderr.append(self._proc.stderr.read()), daemon=True)
+        self._stderr_thread.start()
+        self.closed = False
+
+    def write(self, data):
+        try:
+            self._proc.stdin.write(data)
+        except (BrokenPipeError, OSError):
+            # ffmpeg has exited; the reason is reported by finish()
+            self._finish_process()
+            raise PostProcessingError(f'audio conversion failed: {self._error_message()}')
+        return len(data)
+
+    def flush(self):
+        if not self.closed:
+            self._proc.stdin.flush()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+
+    def finish(self):
+        """Wait for ffmpeg and move the output into place. Returns the output path"""
+        returncode = self._finish_process()
+        temp_path = prepend_extension(self.out_path, 'temp')
+        if returncode != 0:
+            self._remove(temp_path)
+            raise PostProcessingError(f'audio conversion failed: {self._error_message()}')
+        os.replace(temp_path, self.out_path)
+        return self.out_path
+
+    def abort(self):
+        """Kill ffmpeg and remove the partial output"""
+        self.closed = True
+        self._proc.kill()
+        self._finish_process()
+        self._remove(prepend_extension(self.out_path, 'temp'))
+
+    def _finish_process(self):
+        self.close()
+        returncode = self._proc.wait()
+        self._stderr_thread.join()
+        return returncode
+
+    def _error_message(self):
+        stderr = b''.join(self._stderr).decode('utf-8', 'replace').strip()
+        return stderr.splitlines()[-1] if stderr else f'ffmpeg exited with code {self._proc.returncode}'
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 
 class FFmpegVideoConvertorPP(FFmpegPostProcessor):
     SUPPORTED_EXTS = (
@@ -829,7 +1019,7 @@ class FFmpegMergerPP(FFmpegPostProcessor):
         for (i, fmt) in enumerate(info['requested_formats']):
             if fmt.get('acodec') != 'none':
                 args.extend(['-map', f'{i}:a:0'])
-                aac_fixup = fmt['protocol'].startswith('m3u8') and self.get_audio_codec(fmt['filepath']) == 'aac'
+                aac_fixup = fmt['protocol'].startswith('m3u8') and self.get_audio_codec(fmt['filepath'], fmt) == 'aac'
                 if aac_fixup:
                     args.extend([f'-bsf:a:{audio_streams}', 'aac_adtstoasc'])
                 audio_streams += 1
@@ -900,7 +1090,7 @@ class FFmpegFixupM3u8PP(FFmpegFixupPostProcessor):
     def run(self, info):
         if all(self._needs_fixup(info)):
             args = ['-f', 'mp4']
-            if self.get_audio_codec(info['filepath']) == 'aac':
+            if self.get_audio_codec(info['filepath'], info) == 'aac':
                 args.extend(['-bsf:a', 'aac_adtstoasc'])
             self._fixup('Fixing MPEG-TS in MP4 container', info['filepath'], [
                 *self.stream_copy_opts(), *args])
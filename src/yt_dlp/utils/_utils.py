@@ -29,6 +29,7 @@ import platform
 import random
 import re
 import shlex
+import shutil
 import socket
 import ssl
 import struct
@@ -2190,6 +2191,53 @@ def get_exe_version(exe, args=['--version'],
     return out and detect_exe_version(out, version_re, unrecognized[0])
 
 
+_exe_probe_results = {}
+
+
+def _exe_fingerprint(exe):
+    """ Returns (path, mtime, size) of the binary that would be run for exe,
+    or None if it cannot be found """
+    path = shutil.which(exe)
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.realpath(path), st.st_mtime_ns, st.st_size
+
+
+def cached_exe_probe(name, exe, probe, cache=None, succeeded=bool):
+    """
+    Returns the result of probe() for the binary exe, running it at most once
+    per process for each (path, mtime, size) of the binary.
+    If a yt_dlp.cache.Cache is given, the (JSON-serializable) result is also
+    persisted there so that later processes can skip the subprocess entirely.
+    Only results for which succeeded(result) is true are kept, a failed probe
+    is run again next time.
+    Returns False without running probe if the binary does not exist
+    """
+    fingerprint = _exe_fingerprint(exe)
+    if fingerprint is None:
+        return False
+    key = (name, *fingerprint)
+    if key in _exe_probe_results:
+        return _exe_probe_results[key]
+
+    path, stamp = fingerprint[0], list(fingerprint[1:])
+    stored = cache.load('exe-probes', f'{name}-{path}', default={}) if cache else {}
+    if stored.get('fingerprint') == stamp and 'result' in stored and succeeded(stored['result']):
+        result = stored['result']
+    else:
+        result = probe()
+        if not succeeded(result):
+            return result
+        if cache:
+            cache.store('exe-probes', f'{name}-{path}', {'fingerprint': stamp, 'result': result})
+    _exe_probe_results[key] = result
+    return result
+
+
 def frange(start=0, stop=None, step=1):
     """Float range"""
     if stop is None:
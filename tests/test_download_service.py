@@ -0,0 +1,54 @@
+"""
+download_service.download gegen einen lokalen HTTP-Server (ohne SoundCloud, ohne ffmpeg).
+
+    python -m pytest tests
+"""
+import functools
+import http.server
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import download_service  # noqa: E402
+from enums import Conversion  # noqa: E402
+
+# MPEG-1 Layer III Frame-Header + Nutzdaten, für yt-dlp reicht die Endung
+_MP3_BYTES = b"ID3\x03\x00\x00\x00\x00\x00\x00" + b"\xff\xfb\x90\x00" + b"\x00" * 4096
+
+
+@pytest.fixture
+def http_root(tmp_path):
+    root = tmp_path / "www"
+    root.mkdir()
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.parametrize("policy", [download_service.OUTPUT_MP3, download_service.OUTPUT_ORIGINAL])
+def test_kept_file_has_extension(tmp_path, http_root, policy):
+    root, base_url = http_root
+    (root / "track.mp3").write_bytes(_MP3_BYTES)
+    out_path = tmp_path / "out" / "Artist_-_T.mp3"
+
+    downloaded = download_service.download(
+        {"webpage_url": f"{base_url}/track.mp3"}, out_path, policy=policy
+    )
+
+    assert download_service.conversion_for(downloaded, policy) is Conversion.KEEP
+    assert Path(downloaded["filepath"]) == out_path
+    assert out_path.read_bytes() == _MP3_BYTES
+    assert [p.name for p in out_path.parent.iterdir()] == [out_path.name]
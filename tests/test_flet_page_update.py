@@ -0,0 +1,92 @@
+"""
+Page-weite Updates (page.update()) mit Dirty-Tracking gegen eine aufzeichnende Verbindung.
+
+    python -m pytest tests
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import flet as ft  # noqa: E402
+from flet.core.connection import Connection  # noqa: E402
+from flet.core.protocol import PageCommandsBatchResponsePayload  # noqa: E402
+
+
+class _RecordingConnection(Connection):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+        self._next_id = 1
+
+    def send_commands(self, session_id, commands):
+        self.commands.extend(commands)
+        results = []
+        for command in commands:
+            if command.name == "add":
+                ids = []
+                for _ in command.commands:
+                    ids.append(f"_{self._next_id}")
+                    self._next_id += 1
+                results.append(" ".join(ids))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+
+@pytest.fixture
+def page():
+    loop = asyncio.new_event_loop()
+    conn = _RecordingConnection()
+    page = ft.Page(conn, "session", loop)
+    page.update()
+    yield page
+    loop.close()
+
+
+def _sent(page):
+    conn = page._Page__conn
+    sent = [c for c in conn.commands if c.name == "set"]
+    conn.commands.clear()
+    return [(c.values[0], c.attrs) for c in sent]
+
+
+@pytest.mark.parametrize(
+    "make_control",
+    [
+        lambda: ft.Text("a", style=ft.TextStyle(size=10)),
+        lambda: ft.Container(padding=5, content=ft.Text("a")),
+    ],
+)
+def test_update_after_add(page, make_control):
+    column = ft.Column()
+    page.add(column)
+    control = make_control()
+    column.controls.append(control)
+    page.update()
+    _sent(page)
+
+    control.opacity = 0.5
+    page.update()
+
+    assert _sent(page) == [(control.uid, {"opacity": "0.5"})]
+
+
+def test_in_place_change_of_nested_value(page):
+    text = ft.Text("a", style=ft.TextStyle(size=10))
+    container = ft.Container(border=ft.border.all(1, "red"), content=ft.Text("b"))
+    page.add(ft.Column([ft.Row([text]), container]))
+    _sent(page)
+
+    text.style.size = 20
+    container.border.top = ft.BorderSide(3, "blue")
+    page.update()
+
+    sent = dict(_sent(page))
+    assert sent[text.uid] == {"style": '{"size":20}'}
+    assert '"t":{"w":3,"c":"blue"' in sent[container.uid]["border"]
+    assert len(sent) == 2
+
+    page.update()
+    assert _sent(page) == []
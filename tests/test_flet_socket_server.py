@@ -0,0 +1,95 @@
+"""
+Backpressure der Sende-Queue von FletSocketServer bei einem Client, der nicht mehr liest.
+
+    python -m pytest tests
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import flet as ft  # noqa: E402
+from flet.flet_socket_server import FletSocketServer  # noqa: E402
+
+
+class _StalledWriter:
+    """StreamWriter eines Clients, der erst nach release() wieder liest"""
+
+    def __init__(self):
+        self.readable = asyncio.Event()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+
+    async def drain(self):
+        await self.readable.wait()
+
+    def release(self):
+        self.readable.set()
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_loop_updates_while_worker_waits_for_full_queue():
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+
+    def on_loop(coro):
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=5)
+
+    server = FletSocketServer(loop, max_queued_messages=4)
+
+    async def start_send_loop():
+        writer = _StalledWriter()
+        return writer, asyncio.create_task(server._FletSocketServer__send_loop(writer))
+
+    async def stop_send_loop():
+        send_loop.cancel()
+        await asyncio.gather(send_loop, return_exceptions=True)
+
+    writer, send_loop = on_loop(start_send_loop())
+    page = ft.Page(server, "session", loop)
+    worker_text, loop_text = ft.Text("0"), ft.Text("0")
+    page.add(worker_text, loop_text)
+    queue = server._FletSocketServer__send_queue
+
+    def worker():
+        for i in range(1, 20):
+            worker_text.value = str(i)
+            page.update()
+
+    worker_thread = threading.Thread(target=worker, daemon=True)
+    worker_thread.start()
+    # the send loop hangs in drain(), the worker waits until the queue has room again
+    assert _wait_until(lambda: len(queue) >= 4)
+    assert worker_thread.is_alive()
+
+    async def update_from_loop():
+        # like ProgressAggregator.flush / LogView.render
+        loop_text.value = "loop"
+        page.update()
+
+    on_loop(update_from_loop())
+    assert len(queue) == 5
+
+    loop.call_soon_threadsafe(writer.release)
+    worker_thread.join(timeout=5)
+    assert not worker_thread.is_alive()
+    assert _wait_until(lambda: not queue)
+
+    on_loop(stop_send_loop())
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join(timeout=5)
+    loop.close()